@@ -1,23 +1,30 @@
+import os
 import re
 import uuid
 import time
 import random
+import threading
 import pickle
+import logging
 import requests
 from PIL import Image
 
 import nltk
 import numpy as np
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 
 import base64
+import hashlib
 import joblib
+import cachetools
 import pandas as pd
 from gtts import gTTS
 from deep_translator import GoogleTranslator
 
 import streamlit as st
 import streamlit_antd_components as sac
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 import firebase_admin
 from firebase_admin import auth, credentials
@@ -421,11 +428,7 @@ if "themes" not in st.session_state:
 
 def change_streamlit_theme():
     previous_theme = st.session_state.themes["current_theme"]
-    tdict = (
-        st.session_state.themes["light"]
-        if st.session_state.themes["current_theme"] == "light"
-        else st.session_state.themes["dark"]
-    )
+    tdict = st.session_state.themes[previous_theme]
 
     for vkey, vval in tdict.items():
         if vkey.startswith("theme"):
@@ -445,20 +448,16 @@ if st.session_state.themes["refreshed"] == False:
     st.rerun()
 
 
-if "user_authentication_status" not in st.session_state:
-    st.session_state.user_authentication_status = None
-
-if "authenticated_user_email_id" not in st.session_state:
-    st.session_state.authenticated_user_email_id = None
-
-if "authenticated_user_username" not in st.session_state:
-    st.session_state.authenticated_user_username = None
+# Initialize the user authentication details, once for every new app session
+for session_state_key in (
+    "user_authentication_status",
+    "authenticated_user_email_id",
+    "authenticated_user_username",
+    "user_display_name",
+):
+    st.session_state.setdefault(session_state_key, None)
 
-if "user_display_name" not in st.session_state:
-    st.session_state.user_display_name = None
-
-if "cache_generate_recommendations" not in st.session_state:
-    st.session_state.cache_generate_recommendations = False
+st.session_state.setdefault("cache_generate_recommendations", False)
 
 
 def set_generate_recommendations_cache_to_true():
@@ -474,7 +473,376 @@ def apply_style_to_sidebar_button(css_file_name):
         st.markdown(f"<style>{file.read()}</style>", unsafe_allow_html=True)
 
 
+# Usage instructions & cautionary messages displayed in the app, kept in one place
+RECOMMENDATION_USAGE_INSTRUCTION = """
+**Here's how you can get started:**
+
+**1. Pick your ingredients**: Select from a list of over 10,000+ ingredients from across culinary traditions
+**2. Find your match**: Browse through our curated list of recipes, discover hidden gems, & get inspired!
+**3. Save your favourite recipes**: Download the PDF documents, or send'em to your registered email id
+"""
+
+USAGE_CAUTION_MESSAGE = """
+**Enjoy the wordplay, but cook with caution!**
+
+Recipes generated by RecipeML are intended for creative exploration only! The results may'nt always be safe, accurate, or edible! You may use it to spark inspiration but always consult trusted sources for reliable cooking information. For more information on safe cooking practices, kindly visit USDAs [FSIS](https://www.fsis.usda.gov/wps/portal/fsis/topics/food-safety-education)
+"""
+
+GENERATION_USAGE_INSTRUCTION = """
+**Here's how you can get started:**
+
+**1. Whisper your wish**: Enter the recipes name or a starting ingredient to get started with your journey
+**2. Discover inspirations**: Explore new recipes, from tried-and-true classics to some unexpected twists
+**3. Save your favourite recipes**: Download the PDF documents, or send'em to your registered email id
+"""
+
+_TRANSLATION_DELIMITER = "\n@@@\n"
+_AUDIO_NAME_TABLE = str.maketrans({"/": None, " ": "_"})
+
+
+@st.cache_resource(show_spinner=False)
+def _initialize_firebase_app():
+    # Fetch credentials & initialize the Firebase app only once for the process
+    try:
+        return firebase_admin.get_app()
+    except ValueError:
+        pass
+
+    firebase_credentials = FirebaseCredentials()
+    firebase_credentials.fetch_firebase_service_credentials(
+        "configurations/recipeml_firebase_secrets.json"
+    )
+
+    firebase_credentials = credentials.Certificate(
+        "configurations/recipeml_firebase_secrets.json"
+    )
+    return firebase_admin.initialize_app(firebase_credentials)
+
+
+@st.cache_resource(show_spinner=False)
+def _auth_tokens():
+    return AuthTokens()
+
+
+@st.cache_resource(show_spinner=False)
+def _resource_registry():
+    return ResourceRegistry()
+
+
+@st.cache_data(show_spinner=False)
+def _b64_asset(asset_path):
+    # Read & base64 encode the GIF asset once, instead of on every script rerun
+    with open(asset_path, "rb") as f:
+        return base64.b64encode(f.read()).decode()
+
+
+@st.cache_resource(show_spinner=False)
+def _ingredients_list(ingredients_list_path):
+    # Deserialize the 10,000+ ingredients dump once and share it across sessions
+    with open(ingredients_list_path, "rb") as recipe_nlg_ingredients_list:
+        return tuple(joblib.load(recipe_nlg_ingredients_list))
+
+
+@st.cache_resource(show_spinner=False)
+def _mongodb():
+    # Reuse a single MongoDB client, and its connection pool across the reruns
+    return MongoDB()
+
+
+@st.cache_resource(show_spinner=False)
+def _mongo_pool():
+    # Shared worker pool to persist the recipes without blocking the script run
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="recipeml_mongo")
+
+
+@st.cache_resource(show_spinner=False)
+def _io_pool():
+    # Shared worker pool for translation, speech synthesis and the recipe storage
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="recipeml_io")
+
+
+@st.cache_resource(show_spinner=False)
+def _file_writer():
+    # Single worker queue, to serialize the exports written to the local disk
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="recipeml_writer")
+
+
+def _write_bytes_to_file(file_path, file_bytes):
+    with open(file_path, "wb") as exported_file:
+        exported_file.write(file_bytes)
+
+
+@st.cache_resource(show_spinner=False)
+def _mailer_pool():
+    # Shared worker pool to deliver the recipe mails, without holding the rerun
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="recipeml_mailer")
+
+
+def _log_failed_delivery(mail_future):
+    # Log the queued mails that failed, as the rerun has long since shown its toast
+    if not mail_future.cancelled() and mail_future.exception() is not None:
+        logging.error(
+            "recipe mail delivery failed", exc_info=mail_future.exception()
+        )
+
+
+@st.cache_data(show_spinner=False)
+def _recommendations_pdf_bytes(
+    recipe_name, recipe_type, recipe_url, recipe_ingredients, recipe_instructions
+):
+    # Generate the recipe PDF once per recipe, and serve its bytes from the cache
+    download_location = PDFUtils().generate_recommendations_pdf(
+        recipe_name,
+        recipe_type,
+        recipe_url,
+        recipe_ingredients,
+        recipe_instructions,
+    )
+
+    with open(download_location, "rb") as pdf_file:
+        return pdf_file.read()
+
+
+def _generate_images_concurrently(image_model, payload, image_sizes):
+    # Generate the recipe images in parallel, sharing the session script context
+    script_run_ctx = get_script_run_ctx()
+
+    def _generate_image(image_size):
+        add_script_run_ctx(threading.current_thread(), script_run_ctx)
+        return image_model.generate_image(payload, *image_size)
+
+    with ThreadPoolExecutor(max_workers=len(image_sizes)) as image_pool:
+        return list(image_pool.map(_generate_image, image_sizes))
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _upload_recipe_image(_image_path, recipe_title, image_width, image_height):
+    # Key the blob on the recipe title and size, so repeat uploads are skipped
+    if _image_path is None:
+        raise FileNotFoundError(f"No generated image available for {recipe_title}")
+
+    blob_key = hashlib.sha1(
+        f"{recipe_title}:{image_width}x{image_height}".encode()
+    ).hexdigest()[:12]
+
+    azure_storage_account = AzureStorageAccount("generated-recipe-images")
+    return azure_storage_account.store_image_in_blob_container(
+        _image_path, f"{blob_key}.png", skip_if_exists=True
+    )
+
+
+def _upload_recommended_recipe_images(azure_storage_account, image_blobs):
+    # Upload the recipe images in parallel, marking the failed ones unavailable
+    def _upload_image(image_blob):
+        try:
+            return azure_storage_account.store_image_in_blob_container(*image_blob)
+        except Exception:
+            return "unavailable"
+
+    with ThreadPoolExecutor(max_workers=8) as upload_pool:
+        return list(upload_pool.map(_upload_image, image_blobs))
+
+
+class _PlaceholderRecipe(Exception):
+    # Raised out of the cached generation, so that st.cache_data won't store it
+    def __init__(self, recipe):
+        super().__init__("PaLM failed, and returned the placeholder recipe")
+        self.recipe = recipe
+
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def _cached_generate_recipe(
+    user_input_query, generate_recipe_by_name, stochasticity, max_token_length
+):
+    # Reuse the generated recipe for identical queries, instead of calling PaLM
+    procedural_text_generation = ProceduralTextGeneration(
+        stochasticity=stochasticity,
+        max_token_length=max_token_length,
+        palm_api_key=_auth_tokens().palm_api_key,
+    )
+
+    generated_recipe = procedural_text_generation.generate_recipe(
+        user_input_query, generate_recipe_by_name=generate_recipe_by_name
+    )
+
+    if ProceduralTextGeneration.is_placeholder_recipe(generated_recipe):
+        raise _PlaceholderRecipe(generated_recipe)
+    return generated_recipe
+
+
+def _generate_recipe(
+    user_input_query, generate_recipe_by_name, stochasticity, max_token_length
+):
+    # Display the placeholder after a PaLM error, without caching it for the query
+    try:
+        return _cached_generate_recipe(
+            user_input_query, generate_recipe_by_name, stochasticity, max_token_length
+        )
+    except _PlaceholderRecipe as placeholder_recipe:
+        return placeholder_recipe.recipe
+
+
+@st.cache_resource(show_spinner=False)
+def _translators():
+    # Thread local translators, kept across the reruns for the pooled threads
+    return threading.local()
+
+
+def _translator(target_language):
+    # Reuse a GoogleTranslator per language & thread, as it mutates its params
+    translators = _translators().__dict__.setdefault("by_language", {})
+
+    if target_language not in translators:
+        translators[target_language] = GoogleTranslator(
+            source="auto", target=target_language
+        )
+    return translators[target_language]
+
+
+@st.cache_resource(show_spinner=False)
+def _translation_cache():
+    # Successful translations of each string, shared across the sessions for a week
+    return cachetools.TTLCache(maxsize=8192, ttl=7 * 24 * 3600), threading.Lock()
+
+
+def _cache_translations(texts, translated_texts, target_language):
+    translation_cache, translation_cache_lock = _translation_cache()
+
+    with translation_cache_lock:
+        for text, translated_text in zip(texts, translated_texts):
+            translation_cache[(text, target_language)] = translated_text
+
+
+def _tr(text, target_language):
+    # Memoize successful translations, so repeated strings skip the API call
+    translation_cache, translation_cache_lock = _translation_cache()
+
+    with translation_cache_lock:
+        translated_text = translation_cache.get((text, target_language))
+
+    if translated_text is None:
+        translated_text = _translator(target_language).translate(text)
+
+        # Only cache the real translations, so a failed call is retried next time
+        if translated_text:
+            _cache_translations([text], [translated_text], target_language)
+    return translated_text
+
+
+def _safe_tr(text, target_language):
+    # Translate the text, returning the original if English or if the call fails
+    if target_language == "en":
+        return text
+
+    try:
+        return _tr(text, target_language) or text
+    except Exception:
+        return text
+
+
+def _translate_batch(texts, target_language):
+    # Serve the cached strings, and translate only the misses in a single request
+    translation_cache, translation_cache_lock = _translation_cache()
+
+    with translation_cache_lock:
+        translated_texts = [
+            translation_cache.get((text, target_language)) for text in texts
+        ]
+
+    uncached_texts = [
+        text
+        for text, translated_text in zip(texts, translated_texts)
+        if translated_text is None
+    ]
+    if not uncached_texts:
+        return translated_texts
+
+    # Join the misses on a unique delimiter, and split the translated text back
+    try:
+        translated_text = _translator(target_language).translate(
+            _TRANSLATION_DELIMITER.join(uncached_texts)
+        )
+        translated_misses = re.split(r"\s*@@@\s*", translated_text)
+
+        if len(translated_misses) != len(uncached_texts):
+            raise ValueError("Delimiter was lost in the batched translation")
+        _cache_translations(uncached_texts, translated_misses, target_language)
+    except Exception:
+        # Fall back to translating every miss on the shared pool, if the batch failed
+        translated_misses = list(
+            _io_pool().map(
+                _safe_tr, uncached_texts, [target_language] * len(uncached_texts)
+            )
+        )
+
+    translated_misses = iter(translated_misses)
+    return [
+        translated_text if translated_text is not None else next(translated_misses)
+        for translated_text in translated_texts
+    ]
+
+
+@st.cache_data(show_spinner=False)
+def _load_resized_image(image_path, image_size):
+    # Resize the bundled placeholder image once, for each of the display sizes
+    with Image.open(image_path) as placeholder_image:
+        return placeholder_image.resize(image_size, Image.Resampling.LANCZOS)
+
+
+def _synthesize_recipe_audio(audio_prompt, target_language, audio_path):
+    # Translate the narration, synthesize the speech, and return the audio bytes
+    audio_prompt = _safe_tr(audio_prompt, target_language)
+
+    tts = gTTS(text=audio_prompt, lang="en", tld="co.in")
+
+    audio_buffer = BytesIO()
+    tts.write_to_fp(audio_buffer)
+    recipe_audio = audio_buffer.getvalue()
+
+    # Hand the export to the queued writer, and return the bytes to the player
+    _file_writer().submit(_write_bytes_to_file, audio_path, recipe_audio)
+    return recipe_audio
+
+
+@st.cache_data(show_spinner=False)
+def _gif_html(asset_path, leading_breaks=0, trailing_breaks=0):
+    # Build the rounded GIF markup once, along with its surrounding line breaks
+    return (
+        "<br>" * leading_breaks
+        + f'<div class="rounded-image"><img src="data:image/png;base64,{_b64_asset(asset_path)}"></div>'
+        + "<br>" * trailing_breaks
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _warm_start_services():
+    # Warm up the translation & the speech endpoints once per process, off-thread
+    def _warm_up():
+        try:
+            _translator("hi").translate("Hello")
+            gTTS(text="Hello", lang="en", tld="co.in").write_to_fp(BytesIO())
+        except Exception:
+            pass
+
+    return _io_pool().submit(_warm_up)
+
+
+def _show_exception_preloader(theme):
+    # Display the themed exception preloader, and return its placeholder element
+    if theme == "dark":
+        exception_preloader = "assets/loading/exception_img.gif"
+    else:
+        exception_preloader = "assets/loading/exception_img_light.gif"
+
+    return st.markdown(
+        _gif_html(exception_preloader, 2, 11),
+        unsafe_allow_html=True,
+    )
+
+
 if __name__ == "__main__":
+    _warm_start_services()
+
     if st.session_state.user_authentication_status is not True:
         with st.sidebar:
             selected_menu_item = sac.menu(
@@ -495,33 +863,12 @@ if __name__ == "__main__":
             )
 
         if selected_menu_item == "RecipML v1: Home":
-            if "user_authentication_status" not in st.session_state:
-                st.session_state.user_authentication_status = None
-
-            if "authenticated_user_email_id" not in st.session_state:
-                st.session_state.authenticated_user_email_id = None
-
-            if "authenticated_user_username" not in st.session_state:
-                st.session_state.authenticated_user_username = None
-
-            if "user_display_name" not in st.session_state:
-                st.session_state.user_display_name = None
-
             try:
-                firebase_credentials = FirebaseCredentials()
-                firebase_credentials.fetch_firebase_service_credentials(
-                    "configurations/recipeml_firebase_secrets.json"
-                )
-
-                firebase_credentials = credentials.Certificate(
-                    "configurations/recipeml_firebase_secrets.json"
-                )
-                firebase_admin.initialize_app(firebase_credentials)
-
+                _initialize_firebase_app()
             except Exception as err:
                 pass
 
-            auth_token = AuthTokens()
+            auth_token = _auth_tokens()
             authentication_status, email_id = login_form()
 
             try:
@@ -565,22 +912,18 @@ if __name__ == "__main__":
             except Exception as error:
                 pass
 
-            resource_registry = ResourceRegistry()
+            resource_registry = _resource_registry()
             try:
                 dotwave_image_path = (
                     resource_registry.loading_assets_dir + "dotwave_intro_img.gif"
                 )
 
-                with open(dotwave_image_path, "rb") as f:
-                    image_data = f.read()
-
-                    encoded_image = base64.b64encode(image_data).decode()
-                    st.write(" ")
-                    # Display base64 encoded image with rounded edge without expander
-                    gif_image = st.markdown(
-                        f'<BR><BR><div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div>',
-                        unsafe_allow_html=True,
-                    )
+                st.write(" ")
+                # Display base64 encoded image with rounded edge without expander
+                gif_image = st.markdown(
+                    _gif_html(dotwave_image_path, 2, 0),
+                    unsafe_allow_html=True,
+                )
             except Exception as error:
                 st.write(error)
 
@@ -591,11 +934,8 @@ if __name__ == "__main__":
 
             with col2:
                 st.markdown("<br>", unsafe_allow_html=True)
-                btn_face = (
-                    st.session_state.themes["light"]["button_face"]
-                    if st.session_state.themes["current_theme"] == "light"
-                    else st.session_state.themes["dark"]["button_face"]
-                )
+                themes = st.session_state.themes
+                btn_face = themes[themes["current_theme"]]["button_face"]
 
                 st.button(
                     btn_face,
@@ -629,20 +969,11 @@ if __name__ == "__main__":
 
         if selected_menu_item == "Create an Account":
             try:
-                firebase_credentials = FirebaseCredentials()
-                firebase_credentials.fetch_firebase_service_credentials(
-                    "configurations/recipeml_firebase_secrets.json"
-                )
-
-                firebase_credentials = credentials.Certificate(
-                    "configurations/recipeml_firebase_secrets.json"
-                )
-                firebase_admin.initialize_app(firebase_credentials)
-
+                _initialize_firebase_app()
             except Exception as err:
                 pass
 
-            auth_token = AuthTokens()
+            auth_token = _auth_tokens()
 
             # Perform authentication using streamlit authenticator, and retrieve user details
             authentication_status, email_id = login_form()
@@ -719,20 +1050,8 @@ if __name__ == "__main__":
             )
 
         if selected_menu_item == "Recommendations":
-            if "user_authentication_status" not in st.session_state:
-                st.session_state.user_authentication_status = None
-
-            if "authenticated_user_email_id" not in st.session_state:
-                st.session_state.authenticated_user_email_id = None
-
-            if "authenticated_user_username" not in st.session_state:
-                st.session_state.authenticated_user_username = None
-
-            if "user_display_name" not in st.session_state:
-                st.session_state.user_display_name = None
-
-            auth_token = AuthTokens()
-            resource_registry = ResourceRegistry()
+            auth_token = _auth_tokens()
+            resource_registry = _resource_registry()
             feature_space_matching = FeatureSpaceMatching()
 
             genisys = GenerativeImageSynthesis(
@@ -749,16 +1068,11 @@ if __name__ == "__main__":
                     resource_registry.loading_assets_dir + "loading_img_light.gif"
                 )
 
-            with open(loading_image_path, "rb") as f:
-                image_data = f.read()
-                encoded_image = base64.b64encode(image_data).decode()
-
             # Load processed list of ingredients from the binary dump to a global var
             try:
-                with open(
-                    resource_registry.ingredients_list_path, "rb"
-                ) as recipe_nlg_ingredients_list:
-                    ingredients_list = joblib.load(recipe_nlg_ingredients_list)
+                ingredients_list = _ingredients_list(
+                    resource_registry.ingredients_list_path
+                )
             except:
                 ingredients_list = [
                     "Bread",
@@ -801,7 +1115,7 @@ if __name__ == "__main__":
 
                 # Display preloader, as the application performs time-intensive tasks
                 gif_image = st.markdown(
-                    f'<br><br><br><br><div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div><br><br><br><br><br><br><br><br><br><br><br>',
+                    _gif_html(loading_image_path, 4, 11),
                     unsafe_allow_html=True,
                 )
 
@@ -894,7 +1208,7 @@ if __name__ == "__main__":
                         "generated-recipe-images"
                     )
                     recommended_recipes_names = []
-                    recommended_recipes_images = []
+                    recommended_recipes_image_blobs = []
 
                     gif_image.empty()  # Stop displaying preloader image on the front end
 
@@ -963,27 +1277,23 @@ if __name__ == "__main__":
 
                     st.image(recipe_image)
 
-                    try:
-                        recommended_recipes_images.append(
-                            azure_storage_account.store_image_in_blob_container(
-                                generated_image_path,
-                                "".join(
-                                    [
-                                        char.lower()
-                                        if char.isalnum()
-                                        else "_"
-                                        if char == " "
-                                        else ""
-                                        for char in recipe_name
-                                    ]
-                                )
-                                + "_"
-                                + recommendation_id
-                                + ".png",
+                    # Queue the image for the batched upload, once every recipe is displayed
+                    recommended_recipes_image_blobs.append(
+                        (
+                            generated_image_path,
+                            "".join(
+                                [
+                                    char.lower()
+                                    if char.isalnum()
+                                    else "_"
+                                    if char == " "
+                                    else ""
+                                    for char in recipe_name
+                                ]
                             )
+                            + f"_{recommendation_id}.png",
                         )
-                    except:
-                        recommended_recipes_images.append("unavailable")
+                    )
                     recommended_recipes_names.append(recipe_name)
 
                     # Shorten recipe name to max 26 characters and add ellipsis if longer
@@ -992,10 +1302,10 @@ if __name__ == "__main__":
                     else:
                         recipe_name = recipe_name[:26] + "..."
 
+                    recipe_name_title = recipe_name.title()  # Title-case the name only once
+
                     # Display the name of the recommended recipe, as an HTML <H6> heading
-                    st.markdown(
-                        "<H6>" + recipe_name.title() + "</H6>", unsafe_allow_html=True
-                    )
+                    st.markdown(f"<H6>{recipe_name_title}</H6>", unsafe_allow_html=True)
 
                     # Display recipe details including the source, URL & preparation time
                     if type(recipe_preperation_time) == list:
@@ -1006,19 +1316,13 @@ if __name__ == "__main__":
                     if preperation_time_in_minutes < 100:
                         if recipe_type == "Gathered" or recipe_type == "Recipes1M":
                             # Determine the type, based on the source of recipe's details
-                            if "Gathered":
-                                recipe_type = recipe_type + " Recipe"
-                            if "Recipes1M" in recipe_type:
+                            if recipe_type == "Recipes1M":
                                 recipe_type = "Recipes 1M Site"
+                            elif recipe_type == "Gathered":
+                                recipe_type = "Gathered Recipe"
 
                             st.markdown(
-                                "<p style='font-size: 16px;'>Cuisine Source: <a href ='https://"
-                                + recipe_url
-                                + "' style='color: #64ABD8;'>"
-                                + recipe_type.title()
-                                + "</A><BR>Takes around "
-                                + str(recipe_preperation_time)
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>Cuisine Source: <a href ='https://{recipe_url}' style='color: #64ABD8;'>{recipe_type.title()}</A><BR>Takes around {recipe_preperation_time} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
                         else:
@@ -1028,46 +1332,32 @@ if __name__ == "__main__":
                                 recipe_type = recipe_type[:15] + "..."
 
                             st.markdown(
-                                "<p style='font-size: 16px;'>"
-                                + recipe_type.title()
-                                + f" • {str(recipe_preperation_time[1])} Calories<BR>Takes around "
-                                + str(recipe_preperation_time[0])
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>{recipe_type.title()} • {recipe_preperation_time[1]} Calories<BR>Takes around {preperation_time_in_minutes} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
 
                     else:
                         if recipe_type == "Gathered" or recipe_type == "Recipes1M":
                             # Determine the type, based on the source of recipe's details
-                            if "Gathered":
-                                recipe_type = recipe_type + " Recipe"
-                            if "Recipes1M" in recipe_type:
+                            if recipe_type == "Recipes1M":
                                 recipe_type = "Recipes 1M Site"
+                            elif recipe_type == "Gathered":
+                                recipe_type = "Gathered Recipe"
 
                             st.markdown(
-                                "<p style='font-size: 16px;'>Cuisine Source: <a href ='https://"
-                                + recipe_url
-                                + "' style='color: #64ABD8;'>"
-                                + recipe_type.title()
-                                + "</A><BR>Takes over a "
-                                + str(recipe_preperation_time)
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>Cuisine Source: <a href ='https://{recipe_url}' style='color: #64ABD8;'>{recipe_type.title()}</A><BR>Takes over a {recipe_preperation_time} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
                         else:
                             # Display the recipe type, & the approximate preperation time
                             st.markdown(
-                                "<p style='font-size: 16px;'>"
-                                + recipe_type.title()
-                                + "Cuisine<BR>Takes over a "
-                                + str(recipe_preperation_time)
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>{recipe_type.title()}Cuisine<BR>Takes over a {recipe_preperation_time} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
 
                     if st.session_state.user_authentication_status is not True:
                         # Generate PDF file with necessary recipe details and usage terms
-                        download_location_0 = pdf_utils.generate_recommendations_pdf(
+                        recipe_pdf_bytes = _recommendations_pdf_bytes(
                             recipe_name,
                             recipe_type,
                             recipe_url,
@@ -1078,9 +1368,9 @@ if __name__ == "__main__":
                         # Display a download button only for the unauthenticated app user
                         st.download_button(
                             label="Download Recipe Details PDF",
-                            data=open(download_location_0, "rb").read(),
+                            data=recipe_pdf_bytes,
                             key="download_button_0",
-                            file_name=recipe_name.replace(" ", "_").lower() + ".pdf",
+                            file_name=f"{recipe_name.replace(' ', '_').lower()}.pdf",
                         )
 
                     else:
@@ -1103,24 +1393,25 @@ if __name__ == "__main__":
                                         recipe_instructions,
                                     )
                                 )
-                                # Send the mail with attachment to the registered mail id
-                                mail_utils.send_recipe_info_to_mail(
+                                # Queue the mail with attachment to the registered mail id
+                                mail_future = _mailer_pool().submit(
+                                    mail_utils.send_recipe_info_to_mail,
                                     recipe_name,
                                     recipe_ingredients,
                                     recipe_instructions,
                                     st.session_state.authenticated_user_email_id,
                                     download_location_0,
                                 )
+                                mail_future.add_done_callback(_log_failed_delivery)
 
-                                # Display the information status upon successful delivery
-                                st.toast("Bon appétit! We've delivered your recipe.")
+                                # Display the information status once the mail is queued
+                                st.toast("Bon appétit! Your recipe is on its way.")
 
                             except Exception as error:
                                 # Display information status upon a unsuccessful delivery
                                 st.toast(
                                     "Whoops! Looks like your recipe ran into a snag."
                                 )
-                                time.sleep(1)
                                 st.toast(
                                     "Please check your connectivity and try again."
                                 )
@@ -1169,27 +1460,23 @@ if __name__ == "__main__":
 
                     st.image(recipe_image)
 
-                    try:
-                        recommended_recipes_images.append(
-                            azure_storage_account.store_image_in_blob_container(
-                                generated_image_path,
-                                "".join(
-                                    [
-                                        char.lower()
-                                        if char.isalnum()
-                                        else "_"
-                                        if char == " "
-                                        else ""
-                                        for char in recipe_name
-                                    ]
-                                )
-                                + "_"
-                                + recommendation_id
-                                + ".png",
+                    # Queue the image for the batched upload, once every recipe is displayed
+                    recommended_recipes_image_blobs.append(
+                        (
+                            generated_image_path,
+                            "".join(
+                                [
+                                    char.lower()
+                                    if char.isalnum()
+                                    else "_"
+                                    if char == " "
+                                    else ""
+                                    for char in recipe_name
+                                ]
                             )
+                            + f"_{recommendation_id}.png",
                         )
-                    except:
-                        recommended_recipes_images.append("unavailable")
+                    )
                     recommended_recipes_names.append(recipe_name)
 
                     # Shorten recipe name to max 26 characters and add ellipsis if longer
@@ -1198,10 +1485,10 @@ if __name__ == "__main__":
                     else:
                         recipe_name = recipe_name[:26] + "..."
 
+                    recipe_name_title = recipe_name.title()  # Title-case the name only once
+
                     # Display the name of the recommended recipe, as an HTML <H6> heading
-                    st.markdown(
-                        "<H6>" + recipe_name.title() + "</H6>", unsafe_allow_html=True
-                    )
+                    st.markdown(f"<H6>{recipe_name_title}</H6>", unsafe_allow_html=True)
 
                     # Display recipe details including the source, URL & preparation time
                     if type(recipe_preperation_time) == list:
@@ -1212,19 +1499,13 @@ if __name__ == "__main__":
                     if preperation_time_in_minutes < 100:
                         if recipe_type == "Gathered" or recipe_type == "Recipes1M":
                             # Determine the type, based on the source of recipe's details
-                            if "Gathered":
-                                recipe_type = recipe_type + " Recipe"
-                            if "Recipes1M" in recipe_type:
+                            if recipe_type == "Recipes1M":
                                 recipe_type = "Recipes 1M Site"
+                            elif recipe_type == "Gathered":
+                                recipe_type = "Gathered Recipe"
 
                             st.markdown(
-                                "<p style='font-size: 16px;'>Cuisine Source: <a href ='https://"
-                                + recipe_url
-                                + "' style='color: #64ABD8;'>"
-                                + recipe_type.title()
-                                + "</A><BR>Takes around "
-                                + str(recipe_preperation_time)
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>Cuisine Source: <a href ='https://{recipe_url}' style='color: #64ABD8;'>{recipe_type.title()}</A><BR>Takes around {recipe_preperation_time} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
                         else:
@@ -1234,46 +1515,32 @@ if __name__ == "__main__":
                                 recipe_type = recipe_type[:15] + "..."
 
                             st.markdown(
-                                "<p style='font-size: 16px;'>"
-                                + recipe_type.title()
-                                + f" • {str(recipe_preperation_time[1])} Calories<BR>Takes around "
-                                + str(recipe_preperation_time[0])
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>{recipe_type.title()} • {recipe_preperation_time[1]} Calories<BR>Takes around {preperation_time_in_minutes} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
 
                     else:
                         if recipe_type == "Gathered" or recipe_type == "Recipes1M":
                             # Determine type, based on the source of the recipe's details
-                            if "Gathered":
-                                recipe_type = recipe_type + " Recipe"
-                            if "Recipes1M" in recipe_type:
+                            if recipe_type == "Recipes1M":
                                 recipe_type = "Recipes 1M Site"
+                            elif recipe_type == "Gathered":
+                                recipe_type = "Gathered Recipe"
 
                             st.markdown(
-                                "<p style='font-size: 16px;'>Cuisine Source: <a href ='https://"
-                                + recipe_url
-                                + "' style='color: #64ABD8;'>"
-                                + recipe_type.title()
-                                + "</A><BR>Takes over a "
-                                + str(recipe_preperation_time)
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>Cuisine Source: <a href ='https://{recipe_url}' style='color: #64ABD8;'>{recipe_type.title()}</A><BR>Takes over a {recipe_preperation_time} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
                         else:
                             # Display the recipe type, & the approximate preperation time
                             st.markdown(
-                                "<p style='font-size: 16px;'>"
-                                + recipe_type.title()
-                                + "Cuisine<BR>Takes over a "
-                                + str(recipe_preperation_time)
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>{recipe_type.title()}Cuisine<BR>Takes over a {recipe_preperation_time} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
 
                     if st.session_state.user_authentication_status is not True:
                         # Generate PDF file with necessary recipe details and usage terms
-                        download_location_3 = pdf_utils.generate_recommendations_pdf(
+                        recipe_pdf_bytes = _recommendations_pdf_bytes(
                             recipe_name,
                             recipe_type,
                             recipe_url,
@@ -1284,9 +1551,9 @@ if __name__ == "__main__":
                         # Display a download button only for the unauthenticated app user
                         st.download_button(
                             label="Download Recipe Details PDF",
-                            data=open(download_location_3, "rb").read(),
-                            key="download_location_3",
-                            file_name=recipe_name.replace(" ", "_").lower() + ".pdf",
+                            data=recipe_pdf_bytes,
+                            key="download_button_3",
+                            file_name=f"{recipe_name.replace(' ', '_').lower()}.pdf",
                         )
 
                     else:
@@ -1309,24 +1576,25 @@ if __name__ == "__main__":
                                         recipe_instructions,
                                     )
                                 )
-                                # Send the mail with attachment to the registered mail id
-                                mail_utils.send_recipe_info_to_mail(
+                                # Queue the mail with attachment to the registered mail id
+                                mail_future = _mailer_pool().submit(
+                                    mail_utils.send_recipe_info_to_mail,
                                     recipe_name,
                                     recipe_ingredients,
                                     recipe_instructions,
                                     st.session_state.authenticated_user_email_id,
                                     download_location_3,
                                 )
+                                mail_future.add_done_callback(_log_failed_delivery)
 
-                                # Display the information status upon successful delivery
-                                st.toast("Bon appétit! We've delivered your recipe.")
+                                # Display the information status once the mail is queued
+                                st.toast("Bon appétit! Your recipe is on its way.")
 
                             except Exception as error:
                                 # Display the information status upon successful delivery
                                 st.toast(
                                     "Whoops! Looks like your recipe ran into a snag."
                                 )
-                                time.sleep(1)
                                 st.toast(
                                     "Please check your connectivity and try again."
                                 )
@@ -1374,27 +1642,23 @@ if __name__ == "__main__":
 
                     st.image(recipe_image)
 
-                    try:
-                        recommended_recipes_images.append(
-                            azure_storage_account.store_image_in_blob_container(
-                                generated_image_path,
-                                "".join(
-                                    [
-                                        char.lower()
-                                        if char.isalnum()
-                                        else "_"
-                                        if char == " "
-                                        else ""
-                                        for char in recipe_name
-                                    ]
-                                )
-                                + "_"
-                                + recommendation_id
-                                + ".png",
+                    # Queue the image for the batched upload, once every recipe is displayed
+                    recommended_recipes_image_blobs.append(
+                        (
+                            generated_image_path,
+                            "".join(
+                                [
+                                    char.lower()
+                                    if char.isalnum()
+                                    else "_"
+                                    if char == " "
+                                    else ""
+                                    for char in recipe_name
+                                ]
                             )
+                            + f"_{recommendation_id}.png",
                         )
-                    except:
-                        recommended_recipes_images.append("unavailable")
+                    )
                     recommended_recipes_names.append(recipe_name)
 
                     # Shorten recipe name to max 26 characters and add ellipsis if longer
@@ -1403,10 +1667,10 @@ if __name__ == "__main__":
                     else:
                         recipe_name = recipe_name[:26] + "..."
 
+                    recipe_name_title = recipe_name.title()  # Title-case the name only once
+
                     # Display the name of the recommended recipe, as an HTML <H6> heading
-                    st.markdown(
-                        "<H6>" + recipe_name.title() + "</H6>", unsafe_allow_html=True
-                    )
+                    st.markdown(f"<H6>{recipe_name_title}</H6>", unsafe_allow_html=True)
 
                     # Display recipe details including the source, URL & preparation time
                     if type(recipe_preperation_time) == list:
@@ -1417,19 +1681,13 @@ if __name__ == "__main__":
                     if preperation_time_in_minutes < 100:
                         if recipe_type == "Gathered" or recipe_type == "Recipes1M":
                             # Determine the type, based on the source of recipe's details
-                            if "Gathered":
-                                recipe_type = recipe_type + " Recipe"
-                            if "Recipes1M" in recipe_type:
+                            if recipe_type == "Recipes1M":
                                 recipe_type = "Recipes 1M Site"
+                            elif recipe_type == "Gathered":
+                                recipe_type = "Gathered Recipe"
 
                             st.markdown(
-                                "<p style='font-size: 16px;'>Cuisine Source: <a href ='https://"
-                                + recipe_url
-                                + "' style='color: #64ABD8;'>"
-                                + recipe_type.title()
-                                + "</A><BR>Takes around "
-                                + str(recipe_preperation_time)
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>Cuisine Source: <a href ='https://{recipe_url}' style='color: #64ABD8;'>{recipe_type.title()}</A><BR>Takes around {recipe_preperation_time} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
                         else:
@@ -1439,46 +1697,32 @@ if __name__ == "__main__":
                                 recipe_type = recipe_type[:15] + "..."
 
                             st.markdown(
-                                "<p style='font-size: 16px;'>"
-                                + recipe_type.title()
-                                + f" • {str(recipe_preperation_time[1])} Calories<BR>Takes around "
-                                + str(recipe_preperation_time[0])
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>{recipe_type.title()} • {recipe_preperation_time[1]} Calories<BR>Takes around {preperation_time_in_minutes} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
 
                     else:
                         if recipe_type == "Gathered" or recipe_type == "Recipes1M":
                             # Determine the type, based on the source of recipe's details
-                            if "Gathered":
-                                recipe_type = recipe_type + " Recipe"
-                            if "Recipes1M" in recipe_type:
+                            if recipe_type == "Recipes1M":
                                 recipe_type = "Recipes 1M Site"
+                            elif recipe_type == "Gathered":
+                                recipe_type = "Gathered Recipe"
 
                             st.markdown(
-                                "<p style='font-size: 16px;'>Cuisine Source: <a href ='https://"
-                                + recipe_url
-                                + "' style='color: #64ABD8;'>"
-                                + recipe_type.title()
-                                + "</A><BR>Takes over a "
-                                + str(recipe_preperation_time)
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>Cuisine Source: <a href ='https://{recipe_url}' style='color: #64ABD8;'>{recipe_type.title()}</A><BR>Takes over a {recipe_preperation_time} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
                         else:
                             # Display the recipe type, & the approximate preperation time
                             st.markdown(
-                                "<p style='font-size: 16px;'>"
-                                + recipe_type.title()
-                                + "Cuisine<BR>Takes over a "
-                                + str(recipe_preperation_time)
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>{recipe_type.title()}Cuisine<BR>Takes over a {recipe_preperation_time} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
 
                     if st.session_state.user_authentication_status is not True:
                         # Generate PDF file with necessary recipe details and usage terms
-                        download_location_1 = pdf_utils.generate_recommendations_pdf(
+                        recipe_pdf_bytes = _recommendations_pdf_bytes(
                             recipe_name,
                             recipe_type,
                             recipe_url,
@@ -1489,9 +1733,9 @@ if __name__ == "__main__":
                         # Display a download button only for the unauthenticated app user
                         st.download_button(
                             label="Download Recipe Details PDF",
-                            data=open(download_location_1, "rb").read(),
-                            key="download_location_1",
-                            file_name=recipe_name.replace(" ", "_").lower() + ".pdf",
+                            data=recipe_pdf_bytes,
+                            key="download_button_1",
+                            file_name=f"{recipe_name.replace(' ', '_').lower()}.pdf",
                         )
 
                     else:
@@ -1514,24 +1758,25 @@ if __name__ == "__main__":
                                         recipe_instructions,
                                     )
                                 )
-                                # Send the mail with attachment to the registered mail id
-                                mail_utils.send_recipe_info_to_mail(
+                                # Queue the mail with attachment to the registered mail id
+                                mail_future = _mailer_pool().submit(
+                                    mail_utils.send_recipe_info_to_mail,
                                     recipe_name,
                                     recipe_ingredients,
                                     recipe_instructions,
                                     st.session_state.authenticated_user_email_id,
                                     download_location_1,
                                 )
+                                mail_future.add_done_callback(_log_failed_delivery)
 
-                                # Display the information status upon successful delivery
-                                st.toast("Bon appétit! We've delivered your recipe.")
+                                # Display the information status once the mail is queued
+                                st.toast("Bon appétit! Your recipe is on its way.")
 
                             except Exception as error:
                                 # Display the information status upon successful delivery
                                 st.toast(
                                     "Whoops! Looks like your recipe ran into a snag."
                                 )
-                                time.sleep(1)
                                 st.toast(
                                     "Please check your connectivity and try again."
                                 )
@@ -1580,27 +1825,23 @@ if __name__ == "__main__":
 
                     st.image(recipe_image)
 
-                    try:
-                        recommended_recipes_images.append(
-                            azure_storage_account.store_image_in_blob_container(
-                                generated_image_path,
-                                "".join(
-                                    [
-                                        char.lower()
-                                        if char.isalnum()
-                                        else "_"
-                                        if char == " "
-                                        else ""
-                                        for char in recipe_name
-                                    ]
-                                )
-                                + "_"
-                                + recommendation_id
-                                + ".png",
+                    # Queue the image for the batched upload, once every recipe is displayed
+                    recommended_recipes_image_blobs.append(
+                        (
+                            generated_image_path,
+                            "".join(
+                                [
+                                    char.lower()
+                                    if char.isalnum()
+                                    else "_"
+                                    if char == " "
+                                    else ""
+                                    for char in recipe_name
+                                ]
                             )
+                            + f"_{recommendation_id}.png",
                         )
-                    except:
-                        recommended_recipes_images.append("unavailable")
+                    )
                     recommended_recipes_names.append(recipe_name)
 
                     # Shorten recipe name to max 26 characters and add ellipsis if longer
@@ -1609,10 +1850,10 @@ if __name__ == "__main__":
                     else:
                         recipe_name = recipe_name[:25] + "..."
 
+                    recipe_name_title = recipe_name.title()  # Title-case the name only once
+
                     # Display the name of the recommended recipe, as an HTML <H6> heading
-                    st.markdown(
-                        "<H6>" + recipe_name.title() + "</H6>", unsafe_allow_html=True
-                    )
+                    st.markdown(f"<H6>{recipe_name_title}</H6>", unsafe_allow_html=True)
 
                     # Display recipe details including the source, URL & preparation time
                     if type(recipe_preperation_time) == list:
@@ -1623,19 +1864,13 @@ if __name__ == "__main__":
                     if preperation_time_in_minutes < 100:
                         if recipe_type == "Gathered" or recipe_type == "Recipes1M":
                             # Determine the type, based on the source of recipe's details
-                            if "Gathered":
-                                recipe_type = recipe_type + " Recipe"
-                            if "Recipes1M" in recipe_type:
+                            if recipe_type == "Recipes1M":
                                 recipe_type = "Recipes 1M Site"
+                            elif recipe_type == "Gathered":
+                                recipe_type = "Gathered Recipe"
 
                             st.markdown(
-                                "<p style='font-size: 16px;'>Cuisine Source: <a href ='https://"
-                                + recipe_url
-                                + "' style='color: #64ABD8;'>"
-                                + recipe_type.title()
-                                + "</A><BR>Takes around "
-                                + str(recipe_preperation_time)
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>Cuisine Source: <a href ='https://{recipe_url}' style='color: #64ABD8;'>{recipe_type.title()}</A><BR>Takes around {recipe_preperation_time} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
                         else:
@@ -1645,46 +1880,32 @@ if __name__ == "__main__":
                                 recipe_type = recipe_type[:15] + "..."
 
                             st.markdown(
-                                "<p style='font-size: 16px;'>"
-                                + recipe_type.title()
-                                + f" • {str(recipe_preperation_time[1])} Calories<BR>Takes around "
-                                + str(recipe_preperation_time[0])
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>{recipe_type.title()} • {recipe_preperation_time[1]} Calories<BR>Takes around {preperation_time_in_minutes} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
 
                     else:
                         if recipe_type == "Gathered" or recipe_type == "Recipes1M":
                             # Determine the type, based on the source of recipe's details
-                            if "Gathered":
-                                recipe_type = recipe_type + " Recipe"
-                            if "Recipes1M" in recipe_type:
+                            if recipe_type == "Recipes1M":
                                 recipe_type = "Recipes 1M Site"
+                            elif recipe_type == "Gathered":
+                                recipe_type = "Gathered Recipe"
 
                             st.markdown(
-                                "<p style='font-size: 16px;'>Cuisine Source: <a href ='https://"
-                                + recipe_url
-                                + "' style='color: #64ABD8;'>"
-                                + recipe_type.title()
-                                + "</A><BR>Takes over a "
-                                + str(recipe_preperation_time)
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>Cuisine Source: <a href ='https://{recipe_url}' style='color: #64ABD8;'>{recipe_type.title()}</A><BR>Takes over a {recipe_preperation_time} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
                         else:
                             # Display the recipe type, & the approximate preperation time
                             st.markdown(
-                                "<p style='font-size: 16px;'>"
-                                + recipe_type.title()
-                                + "Cuisine<BR>Takes over a "
-                                + str(recipe_preperation_time)
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>{recipe_type.title()}Cuisine<BR>Takes over a {recipe_preperation_time} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
 
                     if st.session_state.user_authentication_status is not True:
                         # Generate PDF file with necessary recipe details and usage terms
-                        download_location_4 = pdf_utils.generate_recommendations_pdf(
+                        recipe_pdf_bytes = _recommendations_pdf_bytes(
                             recipe_name,
                             recipe_type,
                             recipe_url,
@@ -1695,9 +1916,9 @@ if __name__ == "__main__":
                         # Display a download button only for the unauthenticated app user
                         st.download_button(
                             label="Download Recipe Details PDF",
-                            data=open(download_location_4, "rb").read(),
-                            key="download_location_4",
-                            file_name=recipe_name.replace(" ", "_").lower() + ".pdf",
+                            data=recipe_pdf_bytes,
+                            key="download_button_4",
+                            file_name=f"{recipe_name.replace(' ', '_').lower()}.pdf",
                         )
 
                     else:
@@ -1720,24 +1941,25 @@ if __name__ == "__main__":
                                         recipe_instructions,
                                     )
                                 )
-                                # Send the mail with attachment to the registered mail id
-                                mail_utils.send_recipe_info_to_mail(
+                                # Queue the mail with attachment to the registered mail id
+                                mail_future = _mailer_pool().submit(
+                                    mail_utils.send_recipe_info_to_mail,
                                     recipe_name,
                                     recipe_ingredients,
                                     recipe_instructions,
                                     st.session_state.authenticated_user_email_id,
                                     download_location_4,
                                 )
+                                mail_future.add_done_callback(_log_failed_delivery)
 
-                                # Display the information status upon successful delivery
-                                st.toast("Bon appétit! We've delivered your recipe.")
+                                # Display the information status once the mail is queued
+                                st.toast("Bon appétit! Your recipe is on its way.")
 
                             except Exception as error:
                                 # Display the information status upon successful delivery
                                 st.toast(
                                     "Whoops! Looks like your recipe ran into a snag."
                                 )
-                                time.sleep(1)
                                 st.toast(
                                     "Please check your connectivity and try again."
                                 )
@@ -1785,27 +2007,23 @@ if __name__ == "__main__":
 
                     st.image(recipe_image)
 
-                    try:
-                        recommended_recipes_images.append(
-                            azure_storage_account.store_image_in_blob_container(
-                                generated_image_path,
-                                "".join(
-                                    [
-                                        char.lower()
-                                        if char.isalnum()
-                                        else "_"
-                                        if char == " "
-                                        else ""
-                                        for char in recipe_name
-                                    ]
-                                )
-                                + "_"
-                                + recommendation_id
-                                + ".png",
+                    # Queue the image for the batched upload, once every recipe is displayed
+                    recommended_recipes_image_blobs.append(
+                        (
+                            generated_image_path,
+                            "".join(
+                                [
+                                    char.lower()
+                                    if char.isalnum()
+                                    else "_"
+                                    if char == " "
+                                    else ""
+                                    for char in recipe_name
+                                ]
                             )
+                            + f"_{recommendation_id}.png",
                         )
-                    except:
-                        recommended_recipes_images.append("unavailable")
+                    )
                     recommended_recipes_names.append(recipe_name)
 
                     # Shorten recipe name to max 26 characters and add ellipsis if longer
@@ -1814,10 +2032,10 @@ if __name__ == "__main__":
                     else:
                         recipe_name = recipe_name[:26] + "..."
 
+                    recipe_name_title = recipe_name.title()  # Title-case the name only once
+
                     # Display the name of the recommended recipe, as an HTML <H6> heading
-                    st.markdown(
-                        "<H6>" + recipe_name.title() + "</H6>", unsafe_allow_html=True
-                    )
+                    st.markdown(f"<H6>{recipe_name_title}</H6>", unsafe_allow_html=True)
 
                     # Display recipe details including the source, URL & preparation time
                     if type(recipe_preperation_time) == list:
@@ -1828,19 +2046,13 @@ if __name__ == "__main__":
                     if preperation_time_in_minutes < 100:
                         if recipe_type == "Gathered" or recipe_type == "Recipes1M":
                             # Determine the type, based on the source of recipe's details
-                            if "Gathered":
-                                recipe_type = recipe_type + " Recipe"
-                            if "Recipes1M" in recipe_type:
+                            if recipe_type == "Recipes1M":
                                 recipe_type = "Recipes 1M Site"
+                            elif recipe_type == "Gathered":
+                                recipe_type = "Gathered Recipe"
 
                             st.markdown(
-                                "<p style='font-size: 16px;'>Cuisine Source: <a href ='https://"
-                                + recipe_url
-                                + "' style='color: #64ABD8;'>"
-                                + recipe_type.title()
-                                + "</A><BR>Takes around "
-                                + str(recipe_preperation_time)
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>Cuisine Source: <a href ='https://{recipe_url}' style='color: #64ABD8;'>{recipe_type.title()}</A><BR>Takes around {recipe_preperation_time} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
                         else:
@@ -1850,46 +2062,32 @@ if __name__ == "__main__":
                                 recipe_type = recipe_type[:15] + "..."
 
                             st.markdown(
-                                "<p style='font-size: 16px;'>"
-                                + recipe_type.title()
-                                + f" • {str(recipe_preperation_time[1])} Calories<BR>Takes around "
-                                + str(recipe_preperation_time[0])
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>{recipe_type.title()} • {recipe_preperation_time[1]} Calories<BR>Takes around {preperation_time_in_minutes} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
 
                     else:
                         if recipe_type == "Gathered" or recipe_type == "Recipes1M":
                             # Determine the type, based on the source of recipe's details
-                            if "Gathered":
-                                recipe_type = recipe_type + " Recipe"
-                            if "Recipes1M" in recipe_type:
+                            if recipe_type == "Recipes1M":
                                 recipe_type = "Recipes 1M Site"
+                            elif recipe_type == "Gathered":
+                                recipe_type = "Gathered Recipe"
 
                             st.markdown(
-                                "<p style='font-size: 16px;'>Cuisine Source: <a href ='https://"
-                                + recipe_url
-                                + "' style='color: #64ABD8;'>"
-                                + recipe_type.title()
-                                + "</A><BR>Takes over a "
-                                + str(recipe_preperation_time)
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>Cuisine Source: <a href ='https://{recipe_url}' style='color: #64ABD8;'>{recipe_type.title()}</A><BR>Takes over a {recipe_preperation_time} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
                         else:
                             # Display the recipe type, & the approximate preperation time
                             st.markdown(
-                                "<p style='font-size: 16px;'>"
-                                + recipe_type.title()
-                                + "Cuisine<BR>Takes over a "
-                                + str(recipe_preperation_time)
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>{recipe_type.title()}Cuisine<BR>Takes over a {recipe_preperation_time} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
 
                     if st.session_state.user_authentication_status is not True:
                         # Generate PDF file with necessary recipe details and usage terms
-                        download_location_2 = pdf_utils.generate_recommendations_pdf(
+                        recipe_pdf_bytes = _recommendations_pdf_bytes(
                             recipe_name,
                             recipe_type,
                             recipe_url,
@@ -1900,9 +2098,9 @@ if __name__ == "__main__":
                         # Display a download button only for the unauthenticated app user
                         st.download_button(
                             label="Download Recipe Details PDF",
-                            data=open(download_location_2, "rb").read(),
-                            key="download_location_2",
-                            file_name=recipe_name.replace(" ", "_").lower() + ".pdf",
+                            data=recipe_pdf_bytes,
+                            key="download_button_2",
+                            file_name=f"{recipe_name.replace(' ', '_').lower()}.pdf",
                         )
 
                     else:
@@ -1925,24 +2123,25 @@ if __name__ == "__main__":
                                         recipe_instructions,
                                     )
                                 )
-                                # Send the mail with attachment to the registered mail id
-                                mail_utils.send_recipe_info_to_mail(
+                                # Queue the mail with attachment to the registered mail id
+                                mail_future = _mailer_pool().submit(
+                                    mail_utils.send_recipe_info_to_mail,
                                     recipe_name,
                                     recipe_ingredients,
                                     recipe_instructions,
                                     st.session_state.authenticated_user_email_id,
                                     download_location_2,
                                 )
+                                mail_future.add_done_callback(_log_failed_delivery)
 
-                                # Display the information status upon successful delivery
-                                st.toast("Bon appétit! We've delivered your recipe.")
+                                # Display the information status once the mail is queued
+                                st.toast("Bon appétit! Your recipe is on its way.")
 
                             except Exception as error:
                                 # Display the information status upon successful delivery
                                 st.toast(
                                     "Whoops! Looks like your recipe ran into a snag."
                                 )
-                                time.sleep(1)
                                 st.toast(
                                     "Please check your connectivity and try again."
                                 )
@@ -1991,27 +2190,23 @@ if __name__ == "__main__":
 
                     st.image(recipe_image)
 
-                    try:
-                        recommended_recipes_images.append(
-                            azure_storage_account.store_image_in_blob_container(
-                                generated_image_path,
-                                "".join(
-                                    [
-                                        char.lower()
-                                        if char.isalnum()
-                                        else "_"
-                                        if char == " "
-                                        else ""
-                                        for char in recipe_name
-                                    ]
-                                )
-                                + "_"
-                                + recommendation_id
-                                + ".png",
+                    # Queue the image for the batched upload, once every recipe is displayed
+                    recommended_recipes_image_blobs.append(
+                        (
+                            generated_image_path,
+                            "".join(
+                                [
+                                    char.lower()
+                                    if char.isalnum()
+                                    else "_"
+                                    if char == " "
+                                    else ""
+                                    for char in recipe_name
+                                ]
                             )
+                            + f"_{recommendation_id}.png",
                         )
-                    except:
-                        recommended_recipes_images.append("unavailable")
+                    )
                     recommended_recipes_names.append(recipe_name)
 
                     # Shorten recipe name to max 26 characters and add ellipsis if longer
@@ -2020,10 +2215,10 @@ if __name__ == "__main__":
                     else:
                         recipe_name = recipe_name[:25] + "..."
 
+                    recipe_name_title = recipe_name.title()  # Title-case the name only once
+
                     # Display the name of the recommended recipe, as an HTML <H6> heading
-                    st.markdown(
-                        "<H6>" + recipe_name.title() + "</H6>", unsafe_allow_html=True
-                    )
+                    st.markdown(f"<H6>{recipe_name_title}</H6>", unsafe_allow_html=True)
 
                     # Display recipe details including the source, URL & preparation time
                     if type(recipe_preperation_time) == list:
@@ -2034,19 +2229,13 @@ if __name__ == "__main__":
                     if preperation_time_in_minutes < 100:
                         if recipe_type == "Gathered" or recipe_type == "Recipes1M":
                             # Determine the type, based on the source of recipe's details
-                            if "Gathered":
-                                recipe_type = recipe_type + " Recipe"
-                            if "Recipes1M" in recipe_type:
+                            if recipe_type == "Recipes1M":
                                 recipe_type = "Recipes 1M Site"
+                            elif recipe_type == "Gathered":
+                                recipe_type = "Gathered Recipe"
 
                             st.markdown(
-                                "<p style='font-size: 16px;'>Cuisine Source: <a href ='https://"
-                                + recipe_url
-                                + "' style='color: #64ABD8;'>"
-                                + recipe_type.title()
-                                + "</A><BR>Takes around "
-                                + str(recipe_preperation_time)
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>Cuisine Source: <a href ='https://{recipe_url}' style='color: #64ABD8;'>{recipe_type.title()}</A><BR>Takes around {recipe_preperation_time} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
                         else:
@@ -2056,46 +2245,32 @@ if __name__ == "__main__":
                                 recipe_type = recipe_type[:15] + "..."
 
                             st.markdown(
-                                "<p style='font-size: 16px;'>"
-                                + recipe_type.title()
-                                + f" • {str(recipe_preperation_time[1])} Calories<BR>Takes around "
-                                + str(recipe_preperation_time[0])
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>{recipe_type.title()} • {recipe_preperation_time[1]} Calories<BR>Takes around {preperation_time_in_minutes} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
 
                     else:
                         if recipe_type == "Gathered" or recipe_type == "Recipes1M":
                             # Determine the type, based on the source of recipe's details
-                            if "Gathered":
-                                recipe_type = recipe_type + " Recipe"
-                            if "Recipes1M" in recipe_type:
+                            if recipe_type == "Recipes1M":
                                 recipe_type = "Recipes 1M Site"
+                            elif recipe_type == "Gathered":
+                                recipe_type = "Gathered Recipe"
 
                             st.markdown(
-                                "<p style='font-size: 16px;'>Cuisine Source: <a href ='https://"
-                                + recipe_url
-                                + "' style='color: #64ABD8;'>"
-                                + recipe_type.title()
-                                + "</A><BR>Takes over a "
-                                + str(recipe_preperation_time)
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>Cuisine Source: <a href ='https://{recipe_url}' style='color: #64ABD8;'>{recipe_type.title()}</A><BR>Takes over a {recipe_preperation_time} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
                         else:
                             # Display the recipe type, & the approximate preperation time
                             st.markdown(
-                                "<p style='font-size: 16px;'>"
-                                + recipe_type.title()
-                                + "Cuisine<BR>Takes over a "
-                                + str(recipe_preperation_time)
-                                + " mins to prepare<BR>",
+                                f"<p style='font-size: 16px;'>{recipe_type.title()}Cuisine<BR>Takes over a {recipe_preperation_time} mins to prepare<BR>",
                                 unsafe_allow_html=True,
                             )
 
                     if st.session_state.user_authentication_status is not True:
                         # Generate PDF file with necessary recipe details and usage terms
-                        download_location_5 = pdf_utils.generate_recommendations_pdf(
+                        recipe_pdf_bytes = _recommendations_pdf_bytes(
                             recipe_name,
                             recipe_type,
                             recipe_url,
@@ -2106,9 +2281,9 @@ if __name__ == "__main__":
                         # Display a download button only for the unauthenticated app user
                         st.download_button(
                             label="Download Recipe Details PDF",
-                            data=open(download_location_5, "rb").read(),
-                            key="download_location_5",
-                            file_name=recipe_name.replace(" ", "_").lower() + ".pdf",
+                            data=recipe_pdf_bytes,
+                            key="download_button_5",
+                            file_name=f"{recipe_name.replace(' ', '_').lower()}.pdf",
                         )
 
                     else:
@@ -2131,24 +2306,25 @@ if __name__ == "__main__":
                                         recipe_instructions,
                                     )
                                 )
-                                # Send the mail with attachment to the registered mail id
-                                mail_utils.send_recipe_info_to_mail(
+                                # Queue the mail with attachment to the registered mail id
+                                mail_future = _mailer_pool().submit(
+                                    mail_utils.send_recipe_info_to_mail,
                                     recipe_name,
                                     recipe_ingredients,
                                     recipe_instructions,
                                     st.session_state.authenticated_user_email_id,
                                     download_location_5,
                                 )
+                                mail_future.add_done_callback(_log_failed_delivery)
 
-                                # Display the information status upon successful delivery
-                                st.toast("Bon appétit! We've delivered your recipe.")
+                                # Display the information status once the mail is queued
+                                st.toast("Bon appétit! Your recipe is on its way.")
 
                             except Exception as error:
                                 # Display the information status upon successful delivery
                                 st.toast(
                                     "Whoops! Looks like your recipe ran into a snag."
                                 )
-                                time.sleep(1)
                                 st.toast(
                                     "Please check your connectivity and try again."
                                 )
@@ -2158,15 +2334,22 @@ if __name__ == "__main__":
                     unsafe_allow_html=True,
                 )
 
+                # Upload all of the recommended recipe images together, in one batch
+                recommended_recipes_images = _upload_recommended_recipe_images(
+                    azure_storage_account, recommended_recipes_image_blobs
+                )
+
                 try:
-                    mongo = MongoDB()
+                    mongo = _mongodb()
 
                     if st.session_state.authenticated_user_username is not None:
                         username = st.session_state.authenticated_user_username
                     else:
                         username = "guest_user"
 
-                    mongo.store_recommended_recipes(
+                    # Persist the recommendations in background, off the rendering path
+                    _mongo_pool().submit(
+                        mongo.store_recommended_recipes,
                         username,
                         recommendation_id,
                         input_ingredients,
@@ -2185,12 +2368,8 @@ if __name__ == "__main__":
                         resource_registry.loading_assets_dir + "dotwave_intro_img.gif"
                     )
 
-                    with open(dotwave_image_path, "rb") as f:
-                        image_data = f.read()
-                        encoded_image = base64.b64encode(image_data).decode()
-
                     gif_image = st.markdown(
-                        f'<br><div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div>',
+                        _gif_html(dotwave_image_path, 1, 0),
                         unsafe_allow_html=True,
                     )
                 except:
@@ -2198,6 +2377,9 @@ if __name__ == "__main__":
 
                 # Display a welcoming message to user with a randomly chosen recipe emoji
                 cuisines_emojis = ["🍜", "🍩", "🍚", "🍝", "🍦", "🍣"]
+                welcome_emoji = st.session_state.setdefault(
+                    "welcome_emoji", random.choice(cuisines_emojis)
+                )  # Pick the emoji once per session, so that it is stable across reruns
 
                 cola, colb = st.columns([11.5, 1])
 
@@ -2207,29 +2389,26 @@ if __name__ == "__main__":
 
                         try:
                             st.markdown(
-                                f"<H1>Welcome {user_first_name} {random.choice(cuisines_emojis)}</H1>",
+                                f"<H1>Welcome {user_first_name} {welcome_emoji}</H1>",
                                 unsafe_allow_html=True,
                             )
 
                         except:
                             st.markdown(
-                                f"<H1>Hello there {random.choice(cuisines_emojis)}</H1>",
+                                f"<H1>Hello there {welcome_emoji}</H1>",
                                 unsafe_allow_html=True,
                             )
 
                     else:
                         st.markdown(
-                            f"<H1>Hello there {random.choice(cuisines_emojis)}</H1>",
+                            f"<H1>Hello there {welcome_emoji}</H1>",
                             unsafe_allow_html=True,
                         )
 
                 with colb:
                     st.markdown("<br>", unsafe_allow_html=True)
-                    btn_face = (
-                        st.session_state.themes["light"]["button_face"]
-                        if st.session_state.themes["current_theme"] == "light"
-                        else st.session_state.themes["dark"]["button_face"]
-                    )
+                    themes = st.session_state.themes
+                    btn_face = themes[themes["current_theme"]]["button_face"]
 
                     st.button(
                         btn_face,
@@ -2254,15 +2433,9 @@ if __name__ == "__main__":
                 )
 
                 # Display usage instructions in an informative box for easy understanding
-                usage_instruction = """
-                **Here's how you can get started:**
 
-                **1. Pick your ingredients**: Select from a list of over 10,000+ ingredients from across culinary traditions
-                **2. Find your match**: Browse through our curated list of recipes, discover hidden gems, & get inspired!
-                **3. Save your favourite recipes**: Download the PDF documents, or send'em to your registered email id
-                """
                 st.info(
-                    usage_instruction
+                    RECOMMENDATION_USAGE_INSTRUCTION
                 )  # Display the usage information, to the users
 
                 st.sidebar.markdown("<BR><BR><BR><BR><BR><BR><BR><BR>", unsafe_allow_html=True)
@@ -2270,33 +2443,12 @@ if __name__ == "__main__":
 
         elif selected_menu_item == "Recipe Generation":
             try:
-                firebase_credentials = FirebaseCredentials()
-                firebase_credentials.fetch_firebase_service_credentials(
-                    "configurations/recipeml_firebase_secrets.json"
-                )
-
-                firebase_credentials = credentials.Certificate(
-                    "configurations/recipeml_firebase_secrets.json"
-                )
-                firebase_admin.initialize_app(firebase_credentials)
-
+                _initialize_firebase_app()
             except Exception as err:
                 pass
 
-            if "user_authentication_status" not in st.session_state:
-                st.session_state.user_authentication_status = None
-
-            if "authenticated_user_email_id" not in st.session_state:
-                st.session_state.authenticated_user_email_id = None
-
-            if "authenticated_user_username" not in st.session_state:
-                st.session_state.authenticated_user_username = None
-
-            if "user_display_name" not in st.session_state:
-                st.session_state.user_display_name = None
-
-            auth_token = AuthTokens()
-            resource_registry = ResourceRegistry()
+            auth_token = _auth_tokens()
+            resource_registry = _resource_registry()
 
             # Fetch the preloader image from the assets directory, to be used in this app
             if st.session_state.themes["current_theme"] == "dark":
@@ -2308,10 +2460,6 @@ if __name__ == "__main__":
                     resource_registry.loading_assets_dir + "loading_img_light.gif"
                 )
 
-            with open(loading_image_path, "rb") as f:
-                image_data = f.read()
-                encoded_image = base64.b64encode(image_data).decode()
-
             cola, colb = st.sidebar.columns([2.5, 1])
 
             with cola:
@@ -2332,10 +2480,9 @@ if __name__ == "__main__":
             # Check if the recipe generation's selectbox is set to Generate by Ingredient
             if recipe_generation_type == "Generate by Ingredients":
                 # Load the ingredients list from the resource registry into the selectbox
-                with open(
-                    resource_registry.ingredients_list_path, "rb"
-                ) as recipe_nlg_ingredients:
-                    ingredients_list = joblib.load(recipe_nlg_ingredients)
+                ingredients_list = _ingredients_list(
+                    resource_registry.ingredients_list_path
+                )
 
                 # Display sidebar with selectbox for a user to select the ingredients
                 input_selected_ingredients = st.sidebar.selectbox(
@@ -2348,7 +2495,7 @@ if __name__ == "__main__":
                 if input_selected_ingredients:
                     # Display the preloader, as the web app performs time intensive tasks
                     gif_image = st.markdown(
-                        f'<br><br><br><br><div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div><br><br><br><br><br><br><br><br><br><br><br>',
+                        _gif_html(loading_image_path, 4, 11),
                         unsafe_allow_html=True,
                     )
 
@@ -2358,14 +2505,7 @@ if __name__ == "__main__":
                                 "Cooking up some tasty ideas"
                             )  # Show notifications
 
-                            # Attempt to generate a recipe using ProceduralTextGeneration
-                            procedural_text_generation = ProceduralTextGeneration(
-                                stochasticity=0.3,
-                                max_token_length=1500,
-                                palm_api_key=auth_token.palm_api_key,
-                            )
-
-                            # Fetch various recipe details using ProceduralTextGeneration
+                            # Fetch recipe details generated by ProceduralTextGeneration
                             (
                                 recipe_title,
                                 recipe_ingredients,
@@ -2374,14 +2514,16 @@ if __name__ == "__main__":
                                 serving_size,
                                 recipe_description,
                                 calories_in_recipe,
-                            ) = procedural_text_generation.generate_recipe(
+                            ) = _generate_recipe(
                                 input_selected_ingredients,
                                 generate_recipe_by_name=False,
+                                stochasticity=0.3,
+                                max_token_length=1500,
                             )
                             flag_display_result = True
 
                     except Exception as error:
-                        # Handle exception, display warning and wait for clearing warning
+                        # Handle exception, display a warning that is cleared by the next rerun
                         try:
                             gif_image.empty()
                             st.sidebar.exception(error)
@@ -2390,26 +2532,10 @@ if __name__ == "__main__":
                             st.sidebar.exception(error)
 
                         try:
-                            if st.session_state.themes["current_theme"] == "dark":
-                                exception_preloader = "assets/loading/exception_img.gif"
-                            else:
-                                exception_preloader = (
-                                    "assets/loading/exception_img_light.gif"
-                                )
-
-                            with open(exception_preloader, "rb") as f:
-                                image_data = f.read()
-                                encoded_image = base64.b64encode(image_data).decode()
-
                             # Display exception preloader if the app encounters any error
-                            display_exception_preloader = st.markdown(
-                                f'<br><br><div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div><br><br><br><br><br><br><br><br><br><br><br>',
-                                unsafe_allow_html=True,
+                            display_exception_preloader = _show_exception_preloader(
+                                st.session_state.themes["current_theme"]
                             )
-                            time.sleep(
-                                15
-                            )  # Hold execution before clearing the warnings
-                            display_exception_preloader.empty()
 
                         except:
                             flag_exception_raised = st.warning(
@@ -2417,11 +2543,6 @@ if __name__ == "__main__":
                             )
                             st.sidebar.exception(error)
 
-                            time.sleep(
-                                10
-                            )  # Hold execution before clearing the warnings
-                            flag_exception_raised.empty()
-
                         flag_display_result = False
                 else:
                     flag_display_result = False
@@ -2439,7 +2560,7 @@ if __name__ == "__main__":
                     st.sidebar.markdown("<BR><BR><BR><BR><BR><BR>", unsafe_allow_html=True)
 
                     gif_image = st.markdown(
-                        f'<br><br><br><br><div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div><br><br><br><br><br><br><br><br><br><br><br>',
+                        _gif_html(loading_image_path, 4, 11),
                         unsafe_allow_html=True,
                     )
                     try:
@@ -2448,12 +2569,6 @@ if __name__ == "__main__":
                             st.toast("Cooking up some tasty ideas")
 
                             # Attempt to generate a recipe using ProceduralTextGeneration
-                            procedural_text_generation = ProceduralTextGeneration(
-                                stochasticity=0.7,
-                                max_token_length=1500,
-                                palm_api_key=auth_token.palm_api_key,
-                            )
-
                             (
                                 recipe_title,
                                 recipe_ingredients,
@@ -2462,39 +2577,26 @@ if __name__ == "__main__":
                                 serving_size,
                                 recipe_description,
                                 calories_in_recipe,
-                            ) = procedural_text_generation.generate_recipe(
-                                input_recipe_name, generate_recipe_by_name=True
+                            ) = _generate_recipe(
+                                input_recipe_name,
+                                generate_recipe_by_name=True,
+                                stochasticity=0.7,
+                                max_token_length=1500,
                             )
                             flag_display_result = True
 
                     except Exception as err:
-                        # Handle exception, display warning and wait for clearing warning
+                        # Handle exception, display a warning that is cleared by the next rerun
                         try:
                             gif_image.empty()
 
                         except Exception as error: pass
 
                         try:
-                            if st.session_state.themes["current_theme"] == "dark":
-                                exception_preloader = "assets/loading/exception_img.gif"
-                            else:
-                                exception_preloader = (
-                                    "assets/loading/exception_img_light.gif"
-                                )
-
-                            with open(exception_preloader, "rb") as f:
-                                image_data = f.read()
-                                encoded_image = base64.b64encode(image_data).decode()
-
                             # Display exception preloader if the app encounters any error
-                            display_exception_preloader = st.markdown(
-                                f'<br><br><div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div><br><br><br><br><br><br><br><br><br><br><br>',
-                                unsafe_allow_html=True,
+                            display_exception_preloader = _show_exception_preloader(
+                                st.session_state.themes["current_theme"]
                             )
-                            time.sleep(
-                                15
-                            )  # Hold execution before clearing the warnings
-                            display_exception_preloader.empty()
 
                         except:
                             flag_exception_raised = st.warning(
@@ -2502,36 +2604,17 @@ if __name__ == "__main__":
                             )
                             # st.sidebar.exception(error)
 
-                            time.sleep(
-                                10
-                            )  # Hold execution before clearing the warnings
-                            flag_exception_raised.empty()
-
                         flag_display_result = False
                 else:
                     flag_display_result = False
 
             else:
-                # Handle unknown exception, display warning and wait for clearing warning
+                # Handle unknown exception, display a warning cleared on the next rerun
                 try:
-                    if st.session_state.themes["current_theme"] == "dark":
-                        exception_preloader = "assets/loading/exception_img.gif"
-                    else:
-                        exception_preloader = "assets/loading/exception_img_light.gif"
-
-                    with open(exception_preloader, "rb") as f:
-                        image_data = f.read()
-                        encoded_image = base64.b64encode(image_data).decode()
-
                     # Display exception preloader if the streamlt app encounter any error
-                    display_exception_preloader = st.markdown(
-                        f'<br><br><div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div><br><br><br><br><br><br><br><br><br><br><br>',
-                        unsafe_allow_html=True,
+                    display_exception_preloader = _show_exception_preloader(
+                        st.session_state.themes["current_theme"]
                     )
-                    time.sleep(
-                        15
-                    )  # Hold execution for 15s before clearing the warnings
-                    display_exception_preloader.empty()
 
                 except:
                     flag_exception_raised = st.warning(
@@ -2539,11 +2622,6 @@ if __name__ == "__main__":
                     )
                     # st.sidebar.exception(error)
 
-                    time.sleep(
-                        10
-                    )  # Hold execution for 10s before clearing the warnings
-                    flag_exception_raised.empty()
-
                 flag_display_result = False
 
             if (
@@ -2566,82 +2644,65 @@ if __name__ == "__main__":
                     # Display the preloader, as the web app performs time intensive tasks
                     st.toast("Warming up the digital oven")
 
+                    audio_prompt = f"Hello and welcome to RecipeML! You are listening to the recipe for preparing {recipe_title}. This recipe takes approximately {preperation_time_in_mins} minutes to cook and can be served to {serving_size} people. Before jumping right in, please be advised that recipes generated by RecipeML are intended for creative exploration only. The results may not always be safe, accurate, or edible. You may use it to spark inspiration, but always consult trusted sources for reliable cooking information. For preparing this recipe, you will need {recipe_ingredients}. Now, here's how we'll make magic happen, {recipe_instructions}. Congratulations, chef! Your feast is ready. Grab your utensils, gather your guests, and savor every bite of this delectable dish. Bon appétit!"
+
+                    recipe_audio_name = (
+                        f"{recipe_title.translate(_AUDIO_NAME_TABLE).lower()}_audio.wav"
+                    )
+                    audio_path = f"exports/generated_aud/{recipe_audio_name}"
+
+                    # Synthesize audio in background, overlapping the image generation
+                    recipe_audio_synthesis = _io_pool().submit(
+                        _synthesize_recipe_audio,
+                        audio_prompt,
+                        selected_language,
+                        audio_path,
+                    )
+
                     # Initialize the GenerativeImageSynthesis mode,l for image generation
                     genisys_std_model = GenerativeImageSynthesis(
                         image_quality="standard", enable_gpu_acceleration=False
                     )
 
                     # Generate the primary and secondary images based on the recipe title
-                    generated_primary_image_path = genisys_std_model.generate_image(
-                        recipe_title, 424, 322
+                    (
+                        generated_primary_image_path,
+                        generated_secondary_image_path,
+                    ) = _generate_images_concurrently(
+                        genisys_std_model, recipe_title, [(424, 322), (284, 322)]
                     )
 
                     st.toast("Applying some final touches")
 
-                    generated_secondary_image_path = genisys_std_model.generate_image(
-                        recipe_title, 284, 322
-                    )
-
                     recipe_id = str(uuid.uuid4())[:8]
 
                     try:
-                        azure_storage_account = AzureStorageAccount(
-                            "generated-recipe-images"
-                        )
-
-                        blob_url_primary_image = (
-                            azure_storage_account.store_image_in_blob_container(
-                                generated_primary_image_path, recipe_id + "_primary.png"
+                        # Upload both of the recipe images to the blob container in parallel
+                        with ThreadPoolExecutor(max_workers=2) as upload_pool:
+                            primary_image_upload = upload_pool.submit(
+                                _upload_recipe_image,
+                                generated_primary_image_path,
+                                recipe_title,
+                                424,
+                                322,
                             )
-                        )
-                        blob_url_secondary_image = (
-                            azure_storage_account.store_image_in_blob_container(
+                            secondary_image_upload = upload_pool.submit(
+                                _upload_recipe_image,
                                 generated_secondary_image_path,
-                                recipe_id + "_secondary.png",
+                                recipe_title,
+                                284,
+                                322,
                             )
-                        )
+
+                        blob_url_primary_image = primary_image_upload.result()
+                        blob_url_secondary_image = secondary_image_upload.result()
 
                     except Exception as error:
                         blob_url_primary_image = "unavailable"
                         blob_url_secondary_image = "unavailable"
 
-                    try:
-                        audio_prompt = f"Hello and welcome to RecipeML! You are listening to the recipe for preparing {recipe_title}. This recipe takes approximately {preperation_time_in_mins} minutes to cook and can be served to {serving_size} people. Before jumping right in, please be advised that recipes generated by RecipeML are intended for creative exploration only. The results may not always be safe, accurate, or edible. You may use it to spark inspiration, but always consult trusted sources for reliable cooking information. For preparing this recipe, you will need {recipe_ingredients}. Now, here's how we'll make magic happen, {recipe_instructions}. Congratulations, chef! Your feast is ready. Grab your utensils, gather your guests, and savor every bite of this delectable dish. Bon appétit!"
-
-                        try:
-                            if selected_language != "en":
-                                audio_prompt = GoogleTranslator(
-                                    source="auto", target=selected_language
-                                ).translate(audio_prompt)
-
-                        except Exception as error:
-                            pass
-                        tts = gTTS(text=audio_prompt, lang="en", tld="co.in")
-
-                        recipe_audio_name = (
-                            recipe_title.replace("/", "").replace(" ", "_").lower()
-                            + "_audio.wav"
-                        )
-                        audio_path = f"exports/generated_aud/{recipe_audio_name}"
-
-                        tts.save(audio_path)
-
-                    except Exception as error:
-                        pass
-
                     gif_image.empty()  # Show notification message, & clear the preloader
 
-                try:
-                    if selected_language != "en":
-                        recipe_title = GoogleTranslator(
-                            source="auto", target=selected_language
-                        ).translate(recipe_title)
-                except Exception as error:
-                    pass
-
-                # Display title on the web app's frontend and show the interactive button
-                st.markdown(f"<H2>{recipe_title}</H2>", unsafe_allow_html=True)
-
                 seprating_spaces = "&nbsp&nbsp&nbsp&nbsp&nbsp&nbsp"
 
                 serving_size_content = f"Serving for {serving_size}"
@@ -2650,31 +2711,44 @@ if __name__ == "__main__":
                     f"Requires {preperation_time_in_mins} minutes to prepare"
                 )
 
-                try:
-                    if selected_language != "en":
-                        serving_size_content = GoogleTranslator(
-                            source="auto", target=selected_language
-                        ).translate(serving_size_content)
-                        calories_in_recipe_content = GoogleTranslator(
-                            source="auto", target=selected_language
-                        ).translate(calories_in_recipe_content)
-                        preparation_time_content = GoogleTranslator(
-                            source="auto", target=selected_language
-                        ).translate(preparation_time_content)
+                ingredients_title = "Ingredients"
+                directions_heading = "Recipe Directions"
 
-                except Exception as error:
-                    st.write(error)
+                recipe_ingredients = ", ".join(
+                    recipe_ingredients
+                )  # Display ingredients
+
+                # Translate all of the displayed strings together, in a single request
+                if selected_language != "en":
+                    (
+                        recipe_title,
+                        serving_size_content,
+                        calories_in_recipe_content,
+                        preparation_time_content,
+                        recipe_description,
+                        ingredients_title,
+                        recipe_ingredients,
+                        directions_heading,
+                        recipe_instructions,
+                    ) = _translate_batch(
+                        [
+                            recipe_title,
+                            serving_size_content,
+                            calories_in_recipe_content,
+                            preparation_time_content,
+                            recipe_description,
+                            ingredients_title,
+                            recipe_ingredients,
+                            directions_heading,
+                            recipe_instructions,
+                        ],
+                        selected_language,
+                    )
 
+                # Display title on the web app's frontend, followed by the recipe stats
                 st.markdown(
-                    "<h5>🍜 "
-                    + serving_size_content
-                    + seprating_spaces
-                    + "🔥 "
-                    + calories_in_recipe_content
-                    + seprating_spaces
-                    + "🕓 "
-                    + preparation_time_content
-                    + "</h5><br>",
+                    f"<H2>{recipe_title}</H2>"
+                    f"<h5>🍜 {serving_size_content}{seprating_spaces}🔥 {calories_in_recipe_content}{seprating_spaces}🕓 {preparation_time_content}</h5><br>",
                     unsafe_allow_html=True,
                 )
 
@@ -2683,9 +2757,7 @@ if __name__ == "__main__":
                 # Display the primary and the secondary recipe image on the apps frontend
                 with primary_image:
                     if generated_primary_image_path:
-                        recipe_image_424x322 = Image.open(
-                            generated_primary_image_path
-                        ).resize((424, 322))
+                        st.image(generated_primary_image_path, width=424)
 
                     else:
                         # Use the placeholder image if the primary image is not generated
@@ -2693,19 +2765,11 @@ if __name__ == "__main__":
                             resource_registry.placeholder_image_dir_path
                             + "placeholder_1.png"
                         )
-                        recipe_image_424x322 = Image.open(
-                            placeholder_image_path
-                        ).resize((424, 322))
-
-                    st.image(
-                        recipe_image_424x322
-                    )  # Display the primary image, to users
+                        st.image(_load_resized_image(placeholder_image_path, (424, 322)))
 
                 with secondary_image:
                     if generated_secondary_image_path:
-                        recipe_image_424x322 = Image.open(
-                            generated_secondary_image_path
-                        ).resize((284, 322))
+                        st.image(generated_secondary_image_path, width=284)
 
                     else:
                         # Use a placeholder image if the secondary image is not generated
@@ -2713,100 +2777,38 @@ if __name__ == "__main__":
                             resource_registry.placeholder_image_dir_path
                             + "placeholder_2.png"
                         )
-                        recipe_image_424x322 = Image.open(
-                            placeholder_image_path
-                        ).resize((284, 322))
-
-                    st.image(recipe_image_424x322)
+                        st.image(_load_resized_image(placeholder_image_path, (284, 322)))
 
                 # Display the description of the generated recipe & the recipe ingredient
-                try:
-                    if selected_language != "en":
-                        recipe_description = GoogleTranslator(
-                            source="auto", target=selected_language
-                        ).translate(recipe_description)
-                except Exception as error:
-                    pass
-
-                st.markdown(
-                    f"<p align='justify'>{recipe_description}</p>",
-                    unsafe_allow_html=True,
-                )
-
-                ingredients_title = "Ingredients"
-
-                try:
-                    if selected_language != "en":
-                        ingredients_title = GoogleTranslator(
-                            source="auto", target=selected_language
-                        ).translate(ingredients_title)
-                except Exception as error:
-                    pass
-
-                st.markdown(
-                    "<H3>" + ingredients_title + "</H3>", unsafe_allow_html=True
-                )
-
-                recipe_ingredients = ", ".join(
-                    recipe_ingredients
-                )  # Display ingredients
-                try:
-                    if selected_language != "en":
-                        recipe_ingredients = GoogleTranslator(
-                            source="auto", target=selected_language
-                        ).translate(recipe_ingredients)
-                except Exception as error:
-                    pass
-
                 st.markdown(
+                    f"<p align='justify'>{recipe_description}</p>"
+                    f"<H3>{ingredients_title}</H3>"
                     f"<p align='justify'>{recipe_ingredients}</p>",
                     unsafe_allow_html=True,
                 )
 
                 # Display a cautionary message to the user, about using generated recipes
-                usage_caution_message = """
-                **Enjoy the wordplay, but cook with caution!**
 
-                Recipes generated by RecipeML are intended for creative exploration only! The results may'nt always be safe, accurate, or edible! You may use it to spark inspiration but always consult trusted sources for reliable cooking information. For more information on safe cooking practices, kindly visit USDAs [FSIS](https://www.fsis.usda.gov/wps/portal/fsis/topics/food-safety-education)
-                """
-                st.info(usage_caution_message)
+                st.info(USAGE_CAUTION_MESSAGE)
 
                 # Display the recipe direction heading and the cleaned recipe instruction
-                directions_heading = "Recipe Directions"
-                try:
-                    if selected_language != "en":
-                        directions_heading = GoogleTranslator(
-                            source="auto", target=selected_language
-                        ).translate(directions_heading)
-                except Exception as error:
-                    pass
-
                 st.markdown(
-                    "<H3>" + directions_heading + "</H3>", unsafe_allow_html=True
-                )
-
-                try:
-                    if selected_language != "en":
-                        recipe_instructions = GoogleTranslator(
-                            source="auto", target=selected_language
-                        ).translate(recipe_instructions)
-                except Exception as error:
-                    pass
-
-                st.markdown(
-                    f"<p align='justify'>{recipe_instructions}</p>",
+                    f"<H3>{directions_heading}</H3>"
+                    f"<p align='justify'>{recipe_instructions}</p><BR><BR>",
                     unsafe_allow_html=True,
                 )
 
-                st.markdown("<BR><BR>", unsafe_allow_html=True)
-
                 st.sidebar.write(" ")
                 st.sidebar.markdown(" ", unsafe_allow_html=True)
 
-                st.sidebar.audio(audio_path, format="audio/wav")
+                try:
+                    recipe_audio = recipe_audio_synthesis.result()
+                    st.sidebar.audio(recipe_audio, format="audio/mp3")
+                except Exception as error:
+                    pass  # Skip the audio player, if the speech synthesis has failed
 
                 try:
-                    mongo = MongoDB()
+                    mongo = _mongodb()
 
                     if st.session_state.authenticated_user_username is not None:
                         username = st.session_state.authenticated_user_username
@@ -2818,58 +2820,56 @@ if __name__ == "__main__":
                     else:
                         input_query = input_recipe_name
 
-                    mongo.store_generated_recipes(
-                        username,
-                        recipe_generation_type,
-                        input_query,
-                        selected_language,
-                        recipe_id,
-                        recipe_title,
-                        recipe_ingredients,
-                        recipe_instructions,
-                        serving_size,
-                        preperation_time_in_mins,
-                        calories_in_recipe,
-                        blob_url_primary_image,
-                        blob_url_secondary_image,
-                    )
+                    # Skip the write, if this recipe was already saved during the session
+                    saved_recipe_key = hashlib.blake2b(
+                        f"{username}|{recipe_generation_type}|{input_query}|{selected_language}|{recipe_title}".encode(),
+                        digest_size=16,
+                    ).hexdigest()
+                    saved_recipes = st.session_state.setdefault("saved_recipes", set())
+
+                    if saved_recipe_key not in saved_recipes:
+                        saved_recipes.add(saved_recipe_key)
+
+                        # Persist the generated recipe in background, off the rendering path
+                        _io_pool().submit(
+                            mongo.store_generated_recipes,
+                            username,
+                            recipe_generation_type,
+                            input_query,
+                            selected_language,
+                            recipe_id,
+                            recipe_title,
+                            recipe_ingredients,
+                            recipe_instructions,
+                            serving_size,
+                            preperation_time_in_mins,
+                            calories_in_recipe,
+                            blob_url_primary_image,
+                            blob_url_secondary_image,
+                        )
                 except Exception as error:
                     st.exception(error)
 
             else:
                 try:
                     # Load & display animated GIF for visual appeal, when not inferencing
-                    if st.session_state.themes["current_theme"] == "dark":
-                        loading_gif = "intro_dotwave_img.gif"
-                    else:
-                        loading_gif = "intro_dotwave_img_light.gif"
-
                     dotwave_image_path = (
                         resource_registry.loading_assets_dir + "dotwave_intro_img.gif"
                     )
 
-                    with open(dotwave_image_path, "rb") as f:
-                        image_data = f.read()
-
-                        encoded_image = base64.b64encode(image_data).decode()
-
-                        # Display base64 encoded image with rounded edge without expander
-                        gif_image = st.markdown(
-                            f'<br><br><div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div>',
-                            unsafe_allow_html=True,
-                        )
+                    # Display base64 encoded image with rounded edge without expander
+                    gif_image = st.markdown(
+                        _gif_html(dotwave_image_path, 2, 0),
+                        unsafe_allow_html=True,
+                    )
                 except Exception as error:
                     pass
 
                 # Display a welcoming message to user with a randomly chosen recipe emoji
-                cuisines_emojis = [
-                    "🍜",
-                    "🍩",
-                    "🍚",
-                    "🍝",
-                    "🍦",
-                    "🍣",
-                ]
+                cuisines_emojis = ["🍜", "🍩", "🍚", "🍝", "🍦", "🍣"]
+                welcome_emoji = st.session_state.setdefault(
+                    "welcome_emoji", random.choice(cuisines_emojis)
+                )  # Pick the emoji once per session, so that it is stable across reruns
 
                 cola, colb = st.columns([11.5, 1])
 
@@ -2879,29 +2879,26 @@ if __name__ == "__main__":
 
                         try:
                             st.markdown(
-                                f"<H1>Welcome {user_first_name} {random.choice(cuisines_emojis)}</H1>",
+                                f"<H1>Welcome {user_first_name} {welcome_emoji}</H1>",
                                 unsafe_allow_html=True,
                             )
 
                         except:
                             st.markdown(
-                                f"<H1>Hello there {random.choice(cuisines_emojis)}</H1>",
+                                f"<H1>Hello there {welcome_emoji}</H1>",
                                 unsafe_allow_html=True,
                             )
 
                     else:
                         st.markdown(
-                            f"<H1>Hello there {random.choice(cuisines_emojis)}</H1>",
+                            f"<H1>Hello there {welcome_emoji}</H1>",
                             unsafe_allow_html=True,
                         )
 
                 with colb:
                     st.markdown("<br>", unsafe_allow_html=True)
-                    btn_face = (
-                        st.session_state.themes["light"]["button_face"]
-                        if st.session_state.themes["current_theme"] == "light"
-                        else st.session_state.themes["dark"]["button_face"]
-                    )
+                    themes = st.session_state.themes
+                    btn_face = themes[themes["current_theme"]]["button_face"]
 
                     st.button(
                         btn_face,
@@ -2926,15 +2923,9 @@ if __name__ == "__main__":
                 )
 
                 # Display usage instructions in an informative box for easy understanding
-                usage_instruction = """
-                **Here's how you can get started:**
 
-                **1. Whisper your wish**: Enter the recipes name or a starting ingredient to get started with your journey
-                **2. Discover inspirations**: Explore new recipes, from tried-and-true classics to some unexpected twists
-                **3. Save your favourite recipes**: Download the PDF documents, or send'em to your registered email id
-                """
                 st.info(
-                    usage_instruction
+                    GENERATION_USAGE_INSTRUCTION
                 )  # Display the usage information, to the users
 
                 st.sidebar.markdown("<BR><BR><BR><BR><BR><BR><BR><BR>", unsafe_allow_html=True)
@@ -39,26 +39,24 @@ APIs Used:
 
 Learn about RecipeML :ref:`RecipeML v1: User Interface and Functionality Overview`
 """
+import os
 import re
 import uuid
+import hashlib
+import asyncio
 import random
+import difflib
+import threading
 import requests
-import time
-from PIL import Image
+import cachetools
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 import base64
-import joblib
-import pandas as pd
-from gtts import gTTS
-from deep_translator import GoogleTranslator
 
 import streamlit as st
 import streamlit_antd_components as sac
-
-import firebase_admin
-from firebase_admin import auth, credentials
-
-from cognitive_flux.recipe_generation import ProceduralTextGeneration
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from configurations.api_authtoken import AuthTokens
 from configurations.resource_path import ResourceRegistry
@@ -67,8 +65,6 @@ from configurations.firebase_credentials import FirebaseCredentials
 from database.mongodb import MongoDB
 from database.blob_storage import AzureStorageAccount
 
-from deep_canvas.image_generation import GenerativeImageSynthesis
-
 
 # Set the page title and favicon to be displayed on the streamlit web application
 st.set_page_config(
@@ -76,41 +72,25 @@ st.set_page_config(
     page_icon="assets/images/favicon/recipeml_favicon.png",
 )
 
-# Remove the extra paddings from the top and bottom margin of the block container
-st.markdown(
-    """
-        <style>
-               .block-container {
-                    padding-top: 0.5rem;
-                    padding-bottom: 0rem;
-                }
-        </style>
-    """,
-    unsafe_allow_html=True,
-)
-
-# Hide the streamlit menu & the default footer from the production app's frontend
-st.markdown(
-    """
+# Remove extra paddings, hide the streamlit menu & footer, and unstyle hyperlinks
+_PAGE_CSS = """
     <style>
+        .block-container {
+            padding-top: 0.5rem;
+            padding-bottom: 0rem;
+        }
         #MainMenu  {visibility: hidden;}
         footer {visibility: hidden;}
+        .stMarkdown a {
+            text-decoration: none;
+        }
     </style>
-    """,
-    unsafe_allow_html=True,
-)
-
-# Remove the default styling from the hyperlinks displayed on the web application
-st.markdown(
     """
-    <style>
-    .stMarkdown a {
-        text-decoration: none;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
+
+# Remove the remaining top padding, once the generated recipe is being displayed
+_RESULT_PAGE_CSS = "<style>.block-container {padding-top: 0rem;}</style>"
+
+st.markdown(_PAGE_CSS, unsafe_allow_html=True)
 
 
 if "themes" not in st.session_state:
@@ -157,32 +137,593 @@ def change_streamlit_theme():
         st.session_state.themes["current_theme"] = "dark"
 
 
-if st.session_state.themes["refreshed"] == False:
-    st.session_state.themes["refreshed"] = True
-    st.rerun()
+# The shared I/O pool is sized for the network bound tasks of concurrent renders.
+# Sessions rendering beyond the expected count will queue for a free worker, so
+# set `expected_concurrent_sessions` in the Streamlit secrets for larger servers
+_IO_TASKS_PER_RENDER = 3
+_EXPECTED_CONCURRENT_SESSIONS = 8
 
+_TRANSLATION_DELIMITER = "\n@@@\n"
+_TRANSLATION_CHARACTER_LIMIT = 5000
+_SESSION_TRANSLATIONS_LIMIT = 8
 
-if __name__ == "__main__":
-    # [Recipe Generation](Page 1/2) - The frontend of the streamlit web application
+# Recipe emojis, one of which is randomly chosen for the landing page's greeting
+_CUISINES_EMOJIS = ("🍜", "🍩", "🍚", "🍝", "🍦", "🍣")
 
-    # Function to display RecipeML's home screen, with various interactive elements.
+# Constant sections of the recipe narration, interleaved with the recipe details
+_AUDIO_PROMPT_SECTIONS = (
+    "Hello and welcome to RecipeML! You are listening to the recipe for preparing ",
+    ". This recipe takes approximately ",
+    " minutes to cook and can be served to ",
+    " people. Before jumping right in, please be advised that recipes generated by RecipeML are intended for creative exploration only. The results may not always be safe, accurate, or edible. You may use it to spark inspiration, but always consult trusted sources for reliable cooking information. For preparing this recipe, you will need ",
+    ". Now, here's how we'll make magic happen, ",
+    ". Congratulations, chef! Your feast is ready. Grab your utensils, gather your guests, and savor every bite of this delectable dish. Bon appétit!",
+)
 
-    # The homepage incorporates a dropdown widget on the sidebar that sets paradigm
-    # for recipe generation. Users query is read and then subsequently utilized for
-    # executing multiple task including recipe generation & recipe image generation
+# Static sections of the Discover RecipeML page, each emitted in a single call
+_ABOUT_INTRODUCTION_HTML = (
+    "<H2>RecipeML - Cooking Just Got Smarter!</H2>"
+    "<H4>Start by describing few ingredients and unlock delicious possibilities</H4>"
+    "<P align='justify'>Tired of staring at a fridge full of possibilities, only to end up with the same old stir-fry? Break free from the ordinary, & let RecipeML revolutionize your kitchen experience, with the power of Artificial Intelligence</P>"
+    "<P align='justify'>Start by describing what you have in hand, and RecipeML will work its magic. Whether it's that leftover bag of spinach or a fridge begging for rescue, RecipeML transforms ordinary ingredients into extraordinary dishes. But wait, there's more! Beyond recommending those existing recipes, RecipeML taps into its deep understanding of language generation to conjure up novel recipes, that no cook book has ever dreamt of!!</P>"
+)
 
-    # This web application utilizes the OpenAI API & RunwayMLs Stable Diffusion for
-    # image generation. The model binaries are maintained as GitHubs release assets.
+_ABOUT_PRIVACY_POLICY_HTML = (
+    "<H5>So what are you waiting for? Elevate your cooking game, discover new flavors, and redefine your kitchen escapades with RecipeML, now available across all countries</H5>"
+    "<H3>No Hidden Ingredients Here! - RecipeML v1.3 Privacy Policy</H3>"
+    "<P align='justify'>Safety starts with understanding how we collect and share your data while using RecipeML. We believe that responsible innovation doesn't happen in isolation. As part of our efforts to enhance the outcomes, your usage information & feedback will be collected, and further used to improve our language algorithms</P>"
+    "<P align='justify'><B>•&nbsp&nbsp&nbsp What we collect:</B> We collect your chosen ingredients, feedback on the outcomes & basic app usage data<BR><B>•&nbsp&nbsp&nbsp What we dont:</B> We never share your information with third parties for marketing or advertising purpose</P>"
+    "<P align='justify'>Should you ever wish to discontinue your participation, we encourage you to reach out to us via email. Your privacy and preferences matter and we want to ensure your experience aligns with your comfort level</P>"
+)
 
-    # .. versionadded:: 1.1.0
+# Regular expressions used to validate the sign up form, compiled only once
+_NAME_RE = re.compile(r"^[A-Z][a-z]+( [A-Z][a-z]+)*$")
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9.+_-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_USERNAME_CHARS_RE = re.compile(r"[A-Za-z0-9_.]+")
+
+# Recipe names are matched to earlier ones, ignoring punctuation & small typos
+_QUERY_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+_SIMILAR_QUERY_CUTOFF = 0.92
+
+# Notifications displayed for each of the username validation error codes
+_USERNAME_ERROR_MESSAGES = {
+    "MINIMUM_LENGTH_UID": ("Username too short! Needs 4+ letters.",),
+    "MAXIMUM_LENGTH_UID": ("Username too long! Max 25 letters.",),
+    "INVALID_CHARACTERS": (
+        "Username contains invalid charecters!",
+        "Try again with valid chars (a-z, 0-9, ._)",
+    ),
+    "START_WITH_LETTERS": ("Start your username with a letter.",),
+}
+
+
+@st.cache_resource(show_spinner=False)
+def _initialize_firebase_app():
+    # Import the Admin SDK only once it's needed, and initialize the Firebase app
+    import firebase_admin
+    from firebase_admin import credentials
+
+    try:
+        return firebase_admin.get_app()
+    except ValueError:
+        pass
+
+    firebase_credentials = FirebaseCredentials()
+    firebase_credentials.fetch_firebase_service_credentials(
+        "configurations/recipeml_firebase_secrets.json"
+    )
 
-    # APIs: OpenAI API (Image: DALL.E2) & Google Pathways Language Model (PaLM API)
-    # Dependencies: NLTK, Torch, Diffusers, SkLearn, Pandas, Joblib, Streamlit, PIL
+    firebase_credentials = credentials.Certificate(
+        "configurations/recipeml_firebase_secrets.json"
+    )
+    return firebase_admin.initialize_app(firebase_credentials)
 
-    # NOTE: The API keys used in this module are maintained using streamlit secrets.
-    # When testing locally replace the API keys from ~./streamlit/secrets.toml file.
+
+@st.cache_resource(show_spinner=False)
+def _auth_tokens():
+    return AuthTokens()
+
+
+@st.cache_resource(show_spinner=False)
+def _resource_registry():
+    return ResourceRegistry()
+
+
+def _valid_name(fullname):
+    # Validate the basic structure, and logical name based character restrictions
+    if not _NAME_RE.match(fullname):
+        return False
+
+    return (
+        True  # Name is considered to be valid, only if all conditions are met
+    )
+
+
+def _valid_username(username):
+    # Check for the minimum and maximum length of the password (i.e 4 characters)
+    if len(username) < 4:
+        return False, "MINIMUM_LENGTH_UID"
+    if len(username) > 25:
+        return False, "MAXIMUM_LENGTH_UID"
+
+    # Check for only the allowed characters: letters, numbers, underscores & dots
+    if not _USERNAME_CHARS_RE.fullmatch(username):
+        return False, "INVALID_CHARACTERS"
+
+    # Check if username start with letter. Symbols & digits must not be the first
+    if not username[0].isalpha():
+        return False, "START_WITH_LETTERS"
+
+    return (
+        True,
+        "USERNAME_VALID",
+    )  # Username is valid, if all conditions are met
+
+
+def _valid_email_address(email):
+    # Returns a boolean value indicating whether the mail address is valid or not
+    return _EMAIL_RE.match(email) is not None
+
+
+def _signup_form_errors(name, username, email, password, accept_terms):
+    # Return the notifications for the first failed check, or an empty tuple
+    if not name:
+        return ("Please enter your full name",)
+
+    # Run the constant time checks first, and the pattern based validations last
+    if not accept_terms:
+        return ("Please accept our terms of use",)
+
+    if len(password) < 8:
+        return ("Password too short! Needs 8+ characters.",)
+
+    if not _valid_name(name):
+        return ("Not quite! Double-check your full name.",)
+
+    username_valid, validation_error_message = _valid_username(username)
+
+    if not username_valid:
+        return _USERNAME_ERROR_MESSAGES.get(
+            validation_error_message, ("Invalid Username! Try again.",)
+        )
+
+    if not _valid_email_address(email):
+        return ("Invalid email format. Please try again.",)
+
+    return ()
+
+
+@st.cache_data(show_spinner=False)
+def _b64_asset(asset_path):
+    # Read & base64 encode the image asset once, instead of on every script rerun
+    return base64.b64encode(Path(asset_path).read_bytes()).decode("ascii")
+
+
+@st.cache_data(show_spinner=False)
+def _gif_html(asset_path, leading_breaks=2, trailing_breaks=0):
+    # Build the rounded image markup once per asset, as it never changes per run
+    return (
+        "<br>" * leading_breaks
+        + f'<div class="rounded-image"><img src="data:image/png;base64,{_b64_asset(asset_path)}"></div>'
+        + "<br>" * trailing_breaks
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _discover_icons(theme):
+    # Encode the ten feature icons of the theme together, instead of per rerun
+    icon_prefix = "" if theme == "dark" else "light"
+
+    return tuple(
+        _b64_asset(f"assets/icons/{icon_prefix}{icon_number}.png")
+        for icon_number in range(1, 11)
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _ingredients_list(ingredients_list_path):
+    # Deserialize the 10,000+ ingredients dump once and share it across sessions
+    import joblib
+
+    with open(ingredients_list_path, "rb") as recipe_nlg_ingredients:
+        return tuple(joblib.load(recipe_nlg_ingredients))
+
+
+@st.cache_resource(show_spinner=False)
+def _text_generation_model(stochasticity, max_token_length):
+    # Construct the text generation model once per process, for each parameter set
+    # Imported only once it's needed, as the module pulls in TensorFlow on import
+    from cognitive_flux.recipe_generation import ProceduralTextGeneration
+
+    return ProceduralTextGeneration(
+        stochasticity=stochasticity,
+        max_token_length=max_token_length,
+        palm_api_key=_auth_tokens().palm_api_key,
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _image_generation_model():
+    # Construct the image models & the DALL.E2 client once, and share across runs
+    # Imported only once it's needed, as the module pulls in PyTorch on import
+    from deep_canvas.image_generation import GenerativeImageSynthesis
+
+    return GenerativeImageSynthesis(
+        image_quality="standard", enable_gpu_acceleration=False
+    )
+
+
+class _PlaceholderRecipe(Exception):
+    # Raised out of the cached generation, so that st.cache_data won't store it
+    def __init__(self, recipe):
+        super().__init__("PaLM failed, and returned the placeholder recipe")
+        self.recipe = recipe
+
+
+@st.cache_data(ttl=24 * 3600, max_entries=128, show_spinner=False)
+def _cached_generate_recipe(
+    normalized_query,
+    generate_recipe_by_name,
+    stochasticity,
+    max_token_length,
+    _user_input_query,
+):
+    # Reuse the generated recipe for identical queries, instead of calling PaLM.
+    # Only the normalized query keys the cache, the user's text is the prompt
+    from cognitive_flux.recipe_generation import ProceduralTextGeneration
+
+    procedural_text_generation = _text_generation_model(
+        stochasticity, max_token_length
+    )
+
+    generated_recipe = procedural_text_generation.generate_recipe(
+        _user_input_query, generate_recipe_by_name=generate_recipe_by_name
+    )
+
+    if ProceduralTextGeneration.is_placeholder_recipe(generated_recipe):
+        raise _PlaceholderRecipe(generated_recipe)
+    return generated_recipe
+
+
+@st.cache_data(show_spinner=False)
+def _load_resized_image(image_path, image_size):
+    # Resize the square placeholder image once, for each of the display sizes
+    from PIL import Image
+
+    with Image.open(image_path) as placeholder_image:
+        return placeholder_image.resize(
+            image_size, Image.Resampling.BILINEAR, reducing_gap=2.0
+        )
+
+
+def _generate_recipe_for_session(
+    user_input_query, generate_recipe_by_name, stochasticity
+):
+    # Return the last recipe as is on reruns with the unchanged query, e.g on a
+    # language switch, without normalizing & matching the query all over again
+    last_query, last_recipe = st.session_state.get(
+        "last_generated_recipe", (None, None)
+    )
+
+    if last_query == (user_input_query, generate_recipe_by_name):
+        return last_recipe
+
+    # Pin each generated recipe to the session, so it survives the cache expiry
+    generated_recipes = st.session_state.setdefault("generated_recipes", {})
+
+    # Normalize the case & whitespace, so that trivially different queries match
+    normalized_query = " ".join(user_input_query.split()).lower()
+
+    # Ingredients are picked from a fixed list, so only free text names are matched
+    if generate_recipe_by_name:
+        normalized_query = " ".join(
+            _QUERY_PUNCTUATION_RE.sub(" ", normalized_query).split()
+        )
+
+        # Reuse the recipe of a near duplicate name from the session, if there's one
+        similar_queries = difflib.get_close_matches(
+            normalized_query,
+            [query for query, by_name in generated_recipes if by_name],
+            n=1,
+            cutoff=_SIMILAR_QUERY_CUTOFF,
+        )
+        if similar_queries:
+            normalized_query = similar_queries[0]
+
+    recipe_key = (normalized_query, generate_recipe_by_name)
+
+    if recipe_key not in generated_recipes:
+        try:
+            generated_recipes[recipe_key] = _cached_generate_recipe(
+                normalized_query,
+                generate_recipe_by_name,
+                stochasticity,
+                1500,
+                _user_input_query=user_input_query,
+            )
+        except _PlaceholderRecipe as placeholder_recipe:
+            # Display the placeholder, without pinning it so the next run retries
+            return placeholder_recipe.recipe
+
+    st.session_state.last_generated_recipe = (
+        (user_input_query, generate_recipe_by_name),
+        generated_recipes[recipe_key],
+    )
+    return generated_recipes[recipe_key]
+
+
+@st.cache_resource(show_spinner=False)
+def _io_pool():
+    # Shared worker pool, to overlap translation and speech with image generation.
+    # Each render submits three network bound tasks, so size it for every session
+    try:
+        expected_concurrent_sessions = int(
+            st.secrets.get(
+                "expected_concurrent_sessions", _EXPECTED_CONCURRENT_SESSIONS
+            )
+        )
+    except Exception:
+        expected_concurrent_sessions = _EXPECTED_CONCURRENT_SESSIONS
+
+    return ThreadPoolExecutor(
+        max_workers=_IO_TASKS_PER_RENDER * max(expected_concurrent_sessions, 1),
+        thread_name_prefix="recipeml_io",
+    )
+
+
+def _generate_images_concurrently(image_model, payload, image_sizes):
+    # Generate the recipe images in parallel, sharing the session script context
+    script_run_ctx = get_script_run_ctx()
+
+    def _generate_image(image_size):
+        add_script_run_ctx(threading.current_thread(), script_run_ctx)
+        return image_model.generate_image(payload, *image_size)
+
+    # Use a pool per call, so a session's images never queue behind other sessions
+    image_pool = ThreadPoolExecutor(max_workers=len(image_sizes))
+
+    try:
+        image_futures = [
+            image_pool.submit(_generate_image, image_size)
+            for image_size in image_sizes
+        ]
+
+        # Show only placeholders if the primary image fails, & cancel any pending one
+        if not image_futures[0].result():
+            return [None] * len(image_sizes)
+
+        return [image_future.result() for image_future in image_futures]
+
+    finally:
+        image_pool.shutdown(wait=False, cancel_futures=True)
+
+
+@st.cache_resource(show_spinner=False)
+def _translators():
+    # Thread local translators, kept across the reruns for the pooled threads
+    return threading.local()
+
+
+def _translator(target_language):
+    # Reuse a GoogleTranslator per language & thread, as it mutates its params
+    translators = _translators().__dict__.setdefault("by_language", {})
+
+    if target_language not in translators:
+        from deep_translator import GoogleTranslator
+
+        translators[target_language] = GoogleTranslator(
+            source="auto", target=target_language
+        )
+    return translators[target_language]
+
+
+@st.cache_resource(show_spinner=False)
+def _translation_cache():
+    # Successful translations of each string, shared across the sessions for a week
+    return cachetools.TTLCache(maxsize=8192, ttl=7 * 24 * 3600), threading.Lock()
+
+
+def _cached_translation(text, target_language):
+    # Return the cached translation of the text, or None if it's not cached yet
+    translation_cache, translation_cache_lock = _translation_cache()
+
+    with translation_cache_lock:
+        return translation_cache.get((text, target_language))
+
+
+def _cache_translation(text, target_language, translated_text):
+    translation_cache, translation_cache_lock = _translation_cache()
+
+    with translation_cache_lock:
+        translation_cache[(text, target_language)] = translated_text
+
+
+def _translate_text(text, target_language):
+    # Memoize each translation, so the repeated strings are translated only once
+    if target_language == "en":
+        return text
+
+    translated_text = _cached_translation(text, target_language)
+
+    if translated_text is None:
+        translated_text = _translator(target_language).translate(text)
+        _cache_translation(text, target_language, translated_text)
+    return translated_text
+
+
+async def _translate_concurrently(texts, target_language):
+    # Issue every translation request at once, each one on its own worker thread
+    async def _translate(text):
+        return await asyncio.to_thread(_translate_text, text, target_language)
+
+    return await asyncio.gather(
+        *(_translate(text) for text in texts), return_exceptions=True
+    )
+
+
+def _translate_many(texts, target_language):
+    # Translate the strings together, keeping the original text if a call fails
+    if target_language == "en":
+        return list(texts)
+
+    try:
+        translated_texts = asyncio.run(
+            _translate_concurrently(texts, target_language)
+        )
+    except Exception:
+        return list(texts)
+
+    return [
+        text if isinstance(translated_text, Exception) else translated_text
+        for text, translated_text in zip(texts, translated_texts)
+    ]
+
+
+def _translate_uncached(texts, target_language):
+    # Translate the strings in one request, joined & split on a unique delimiter
+    batched_text = _TRANSLATION_DELIMITER.join(texts)
+
+    # Skip the batch request when it's sure to be rejected for exceeding the limit
+    if len(batched_text) <= _TRANSLATION_CHARACTER_LIMIT:
+        try:
+            translated_text = _translator(target_language).translate(batched_text)
+            translated_texts = re.split(r"\s*@@@\s*", translated_text)
+
+            if len(translated_texts) == len(texts):
+                for text, translated_text in zip(texts, translated_texts):
+                    _cache_translation(text, target_language, translated_text)
+                return translated_texts
+        except Exception:
+            pass
+
+    # Fall back to concurrent per-string calls if the batch fails or is too long
+    return _translate_many(texts, target_language)
+
+
+def _translate_batch(texts, target_language):
+    # Serve the cached strings, and translate only the rest in a single request
+    if target_language == "en":
+        return list(texts)
+
+    translated_texts = [_cached_translation(text, target_language) for text in texts]
+    uncached_indices = [
+        index
+        for index, translated_text in enumerate(translated_texts)
+        if translated_text is None
+    ]
+
+    if uncached_indices:
+        for index, translated_text in zip(
+            uncached_indices,
+            _translate_uncached(
+                [texts[index] for index in uncached_indices], target_language
+            ),
+        ):
+            translated_texts[index] = translated_text
+    return translated_texts
+
+
+def _translate_for_session(texts, target_language):
+    # Reuse the session's earlier translation of the same strings, if available
+    translated_strings = st.session_state.setdefault("translated_strings", {})
+    translation_key = (tuple(texts), target_language)
+
+    # Drop a finished translation that failed, or fell back to the English text,
+    # so that the next rerun translates it again, instead of pinning the fallback
+    recipe_translation = translated_strings.get(translation_key)
+    if recipe_translation is not None and recipe_translation.done():
+        if recipe_translation.exception() is not None or (
+            target_language != "en"
+            and any(
+                translated_text == text
+                for translated_text, text in zip(recipe_translation.result(), texts)
+            )
+        ):
+            del translated_strings[translation_key]
+
+    if translation_key not in translated_strings:
+        # Bound the session's translations, evicting the oldest recipe & language
+        while len(translated_strings) >= _SESSION_TRANSLATIONS_LIMIT:
+            del translated_strings[next(iter(translated_strings))]
+
+        translated_strings[translation_key] = _io_pool().submit(
+            _translate_batch, texts, target_language
+        )
+    return translated_strings[translation_key]
+
+
+def _audio_prompt(*recipe_details):
+    # Join the constant narration sections with the details, in a single pass
+    return "".join(
+        section + str(recipe_detail)
+        for section, recipe_detail in zip(
+            _AUDIO_PROMPT_SECTIONS, (*recipe_details, "")
+        )
+    )
+
+
+def _synthesize_recipe_audio(audio_prompt, target_language):
+    # Translate the narration, and return the path of the synthesized speech file
+    audio_prompt = _translate_batch([audio_prompt], target_language)[0]
+
+    # Name the file after the spoken text, so a failed translation never saves the
+    # English speech in place of the translated one, and skip it if it's existing
+    recipe_audio_hash = hashlib.sha1(audio_prompt.encode()).hexdigest()[:16]
+    audio_path = f"exports/generated_aud/{recipe_audio_hash}.mp3"
+
+    if Path(audio_path).exists():
+        return audio_path
+
+    from gtts import gTTS
+
+    tts = gTTS(text=audio_prompt, lang="en", tld="co.in")
+
+    # Save to a temporary file first, so a partly written file is never reused
+    partial_audio_path = f"{audio_path}.{uuid.uuid4().hex}.part"
+
+    try:
+        tts.save(partial_audio_path)
+        os.replace(partial_audio_path, audio_path)
+    except Exception:
+        Path(partial_audio_path).unlink(missing_ok=True)
+        raise
+
+    return audio_path
+
+
+@st.cache_resource(show_spinner=False)
+def _http_session():
+    # Keep the identity toolkit connections alive, instead of a TLS setup per call
+    http_session = requests.Session()
+    http_session.mount(
+        "https://",
+        requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=20),
+    )
+    return http_session
+
+
+def _show_exception_preloader(error_code):
+    # Display the themed exception preloader, or fall back to a toast notification
+    try:
+        if st.session_state.themes["current_theme"] == "dark":
+            exception_preloader = "assets/loading/exception_img.gif"
+        else:
+            exception_preloader = "assets/loading/exception_img_light.gif"
+
+        st.markdown(_gif_html(exception_preloader, 2, 11), unsafe_allow_html=True)
+
+    except:
+        # The toast is dismissed by the browser, without holding the script thread
+        st.toast(
+            f"Whoops! Looks like your recipe ran into a snag. Try again [Error Code: {error_code}]",
+            icon="⚠️",
+        )
+
+
+def _sidebar_menu():
+    # The menu switches the whole page, so it must stay in the full script run
     with st.sidebar:
-        selected_menu_item = sac.menu(
+        return sac.menu(
             [
                 sac.MenuItem(
                     "Recipe Generation",
@@ -199,35 +740,124 @@ if __name__ == "__main__":
             open_all=True,
         )
 
-    if selected_menu_item == "Recipe Generation":
-        try:
-            firebase_credentials = FirebaseCredentials()
-            firebase_credentials.fetch_firebase_service_credentials(
-                "configurations/recipeml_firebase_secrets.json"
+
+def _render_landing_page(resource_registry):
+    try:
+        # Load & display animated GIF for visual appeal, when not inferencing
+        if st.session_state.themes["current_theme"] == "dark":
+            loading_gif = "intro_dotwave_img.gif"
+        else: loading_gif = "intro_dotwave_img_light.gif"
+
+        dotwave_image_path = (
+            resource_registry.loading_assets_dir + "dotwave_intro_img.gif"
+        )
+
+        # Display base64 encoded image with rounded edge without expander
+        gif_image = st.markdown(_gif_html(dotwave_image_path), unsafe_allow_html=True)
+    except Exception as error:
+        pass
+
+    # Display a welcoming message to user with a randomly chosen recipe emoji
+    cola, colb = st.columns([11.5, 1])
+
+    with cola:
+        if st.session_state.user_display_name is not None:
+            user_first_name = st.session_state.user_display_name.split()[0]
+
+            try:
+                st.markdown(
+                    f"<H1>Welcome {user_first_name} {random.choice(_CUISINES_EMOJIS)}</H1>",
+                    unsafe_allow_html=True,
+                )
+
+            except:
+                st.markdown(
+                f"<H1>Hello there {random.choice(_CUISINES_EMOJIS)}</H1>",
+                unsafe_allow_html=True,
             )
 
-            firebase_credentials = credentials.Certificate(
-                "configurations/recipeml_firebase_secrets.json"
+        else:
+            st.markdown(
+                f"<H1>Hello there {random.choice(_CUISINES_EMOJIS)}</H1>",
+                unsafe_allow_html=True,
             )
-            firebase_admin.initialize_app(firebase_credentials)
 
-        except Exception as err:
-            pass
+    with colb:
+        st.markdown("<br>", unsafe_allow_html=True)
+        btn_face = (
+            st.session_state.themes["light"]["button_face"]
+            if st.session_state.themes["current_theme"] == "light"
+            else st.session_state.themes["dark"]["button_face"]
+        )
 
-        if "user_authentication_status" not in st.session_state:
-            st.session_state.user_authentication_status = None
+        st.button(
+            btn_face,
+            use_container_width=True,
+            type="secondary",
+            on_click=change_streamlit_theme,
+        )
+
+    # Provide a brief description of RecipeMLs recipe generation capabilities
+    subheading_font_color = {"dark": "#C2C2C2", "light": "#424242"}
+    font_color = subheading_font_color[st.session_state.themes["current_theme"]]
+
+    st.markdown(
+        f"<H4 style='color: {font_color}'>Start by describing what you are craving, or what you have on hand!</H4>",
+        unsafe_allow_html=True,
+    )
+    st.markdown(
+        "<P align='justify'>Dreaming of a dish but dont have recipe? Or maybe you've got an ingredient begging to be transformed? Simply describe what you want and RecipeML will generate a mouthwatering recipe that is uniquely yours</P>",
+        unsafe_allow_html=True,
+    )
+
+    # Display usage instructions in an informative box for easy understanding
+    usage_instruction = """
+    **Here's how you can get started:**
+
+    **1. Whisper your wish**: Enter the recipes name or a starting ingredient to get started with your journey
+    **2. Discover inspirations**: Explore new recipes, from tried-and-true classics to some unexpected twists
+    **3. Save your favourite recipes**: Download the PDF documents, or send'em to your registered email id
+    """
+    st.info(usage_instruction)  # Display the usage information, to the users
+
+
+if st.session_state.themes["refreshed"] == False:
+    st.session_state.themes["refreshed"] = True
+    st.rerun()
+
+
+if __name__ == "__main__":
+    # [Recipe Generation](Page 1/2) - The frontend of the streamlit web application
+
+    # Function to display RecipeML's home screen, with various interactive elements.
+
+    # The homepage incorporates a dropdown widget on the sidebar that sets paradigm
+    # for recipe generation. Users query is read and then subsequently utilized for
+    # executing multiple task including recipe generation & recipe image generation
+
+    # This web application utilizes the OpenAI API & RunwayMLs Stable Diffusion for
+    # image generation. The model binaries are maintained as GitHubs release assets.
 
-        if "authenticated_user_email_id" not in st.session_state:
-            st.session_state.authenticated_user_email_id = None
+    # .. versionadded:: 1.1.0
 
-        if "authenticated_user_username" not in st.session_state:
-            st.session_state.authenticated_user_username = None
+    # APIs: OpenAI API (Image: DALL.E2) & Google Pathways Language Model (PaLM API)
+    # Dependencies: NLTK, Torch, Diffusers, SkLearn, Pandas, Joblib, Streamlit, PIL
 
-        if "user_display_name" not in st.session_state:
-            st.session_state.user_display_name = None
+    # NOTE: The API keys used in this module are maintained using streamlit secrets.
+    # When testing locally replace the API keys from ~./streamlit/secrets.toml file.
+    # Initialize the authentication state of the session, shared by both the pages
+    for session_key in (
+        "user_authentication_status",
+        "authenticated_user_email_id",
+        "authenticated_user_username",
+        "user_display_name",
+    ):
+        st.session_state.setdefault(session_key, None)
 
-        auth_token = AuthTokens()
-        resource_registry = ResourceRegistry()
+    selected_menu_item = _sidebar_menu()
+
+    if selected_menu_item == "Recipe Generation":
+        resource_registry = _resource_registry()
 
         # Fetch the preloader image from the assets directory, to be used in this app
         if st.session_state.themes["current_theme"] == "dark":
@@ -239,10 +869,6 @@ if __name__ == "__main__":
                 resource_registry.loading_assets_dir + "loading_img_light.gif"
             )
 
-        with open(loading_image_path, "rb") as f:
-            image_data = f.read()
-            encoded_image = base64.b64encode(image_data).decode()
-
         cola, colb = st.sidebar.columns([2.5, 1])
 
         with cola:
@@ -259,13 +885,13 @@ if __name__ == "__main__":
                 help="Select language",
             )
 
+        # Let users opt out of the image generation, and display placeholders instead
+        st.sidebar.toggle("Skip recipe images", key="skip_images")
+
         # Check if the recipe generation's selectbox is set to Generate by Ingredient
         if recipe_generation_type == "Generate by Ingredients":
             # Load the ingredients list from the resource registry into the selectbox
-            with open(
-                resource_registry.ingredients_list_path, "rb"
-            ) as recipe_nlg_ingredients:
-                ingredients_list = joblib.load(recipe_nlg_ingredients)
+            ingredients_list = _ingredients_list(resource_registry.ingredients_list_path)
 
             # Display sidebar with selectbox for a user to select the ingredients
             input_selected_ingredients = st.sidebar.selectbox(
@@ -278,20 +904,13 @@ if __name__ == "__main__":
             if input_selected_ingredients:
                 # Display the preloader, as the web app performs time intensive tasks
                 gif_image = st.markdown(
-                    f'<br><br><br><br><div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div><br><br><br><br><br><br><br><br><br><br><br>',
+                    _gif_html(loading_image_path, 4, 11),
                     unsafe_allow_html=True,
                 )
                 try:
                     with gif_image:
                         st.toast("Cooking up some tasty ideas")  # Show notifications
 
-                        # Attempt to generate a recipe using ProceduralTextGeneration
-                        procedural_text_generation = ProceduralTextGeneration(
-                            stochasticity=0.3,
-                            max_token_length=1500,
-                            palm_api_key=auth_token.palm_api_key,
-                        )
-
                         # Fetch various recipe details using ProceduralTextGeneration
                         (
                             recipe_title,
@@ -301,48 +920,20 @@ if __name__ == "__main__":
                             serving_size,
                             recipe_description,
                             calories_in_recipe,
-                        ) = procedural_text_generation.generate_recipe(
-                            input_selected_ingredients, generate_recipe_by_name=False
+                        ) = _generate_recipe_for_session(
+                            input_selected_ingredients, False, 0.3
                         )
                         flag_display_result = True
 
                 except Exception as error:
-                    # Handle exception, display warning and wait for clearing warning
+                    # Handle the exception, & show the warning until the next rerun
                     try:
                         gif_image.empty()
-                        st.sidebar.exception(error)
-
-                    except Exception as error:
-                        st.sidebar.exception(error)
-
-                    try:
-                        if st.session_state.themes["current_theme"] == "dark":
-                            exception_preloader = "assets/loading/exception_img.gif"
-                        else:
-                            exception_preloader = (
-                                "assets/loading/exception_img_light.gif"
-                            )
-
-                        with open(exception_preloader, "rb") as f:
-                            image_data = f.read()
-                            encoded_image = base64.b64encode(image_data).decode()
-
-                        # Display exception preloader if the app encounters any error
-                        display_exception_preloader = st.markdown(
-                            f'<br><br><div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div><br><br><br><br><br><br><br><br><br><br><br>',
-                            unsafe_allow_html=True,
-                        )
-                        time.sleep(15)  # Hold execution before clearing the warnings
-                        display_exception_preloader.empty()
-
                     except:
-                        flag_exception_raised = st.warning(
-                            "Whoops! Looks like your recipe ran into a snag. Try again [Error Code: 201]"
-                        )
-                        st.sidebar.exception(error)
+                        pass
 
-                        time.sleep(10)  # Hold execution before clearing the warnings
-                        flag_exception_raised.empty()
+                    st.sidebar.exception(error)
+                    _show_exception_preloader(201)
 
                     flag_display_result = False
             else:
@@ -359,7 +950,7 @@ if __name__ == "__main__":
             # Check if some recipe name is provided by the user, initialized on enter
             if input_recipe_name:
                 gif_image = st.markdown(
-                    f'<br><br><br><br><div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div><br><br><br><br><br><br><br><br><br><br><br>',
+                    _gif_html(loading_image_path, 4, 11),
                     unsafe_allow_html=True,
                 )
                 try:
@@ -367,12 +958,6 @@ if __name__ == "__main__":
                     with gif_image:
                         st.toast("Cooking up some tasty ideas")
                         # Attempt to generate a recipe using ProceduralTextGeneration
-                        procedural_text_generation = ProceduralTextGeneration(
-                            stochasticity=0.7,
-                            max_token_length=1500,
-                            palm_api_key=auth_token.palm_api_key,
-                        )
-
                         (
                             recipe_title,
                             recipe_ingredients,
@@ -381,506 +966,288 @@ if __name__ == "__main__":
                             serving_size,
                             recipe_description,
                             calories_in_recipe,
-                        ) = procedural_text_generation.generate_recipe(
-                            input_recipe_name, generate_recipe_by_name=True
-                        )
+                        ) = _generate_recipe_for_session(input_recipe_name, True, 0.7)
                         flag_display_result = True
 
                 except Exception as err:
-                    # Handle exception, display warning and wait for clearing warning
-                    try:
-                        gif_image.empty()
-
-                    except:
-                        pass
-
-                    try:
-                        if st.session_state.themes["current_theme"] == "dark":
-                            exception_preloader = "assets/loading/exception_img.gif"
-                        else:
-                            exception_preloader = (
-                                "assets/loading/exception_img_light.gif"
-                            )
-
-                        with open(exception_preloader, "rb") as f:
-                            image_data = f.read()
-                            encoded_image = base64.b64encode(image_data).decode()
-
-                        # Display exception preloader if the app encounters any error
-                        display_exception_preloader = st.markdown(
-                            f'<br><br><div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div><br><br><br><br><br><br><br><br><br><br><br>',
-                            unsafe_allow_html=True,
-                        )
-                        time.sleep(15)  # Hold execution before clearing the warnings
-                        display_exception_preloader.empty()
-
-                    except:
-                        flag_exception_raised = st.warning(
-                            "Whoops! Looks like your recipe ran into a snag. Try again [Error Code: 202]"
-                        )
-                        # st.sidebar.exception(error)
-
-                        time.sleep(10)  # Hold execution before clearing the warnings
-                        flag_exception_raised.empty()
-
-                    flag_display_result = False
-            else:
-                flag_display_result = False
-
-        else:
-            # Handle unknown exception, display warning and wait for clearing warning
-            try:
-                if st.session_state.themes["current_theme"] == "dark":
-                    exception_preloader = "assets/loading/exception_img.gif"
-                else:
-                    exception_preloader = "assets/loading/exception_img_light.gif"
-
-                with open(exception_preloader, "rb") as f:
-                    image_data = f.read()
-                    encoded_image = base64.b64encode(image_data).decode()
-
-                # Display exception preloader if the streamlt app encounter any error
-                display_exception_preloader = st.markdown(
-                    f'<br><br><div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div><br><br><br><br><br><br><br><br><br><br><br>',
-                    unsafe_allow_html=True,
-                )
-                time.sleep(15)  # Hold execution for 15s before clearing the warnings
-                display_exception_preloader.empty()
-
-            except:
-                flag_exception_raised = st.warning(
-                    "Whoops! Looks like your recipe ran into a snag. Try again [Error Code: 203]"
-                )
-                # st.sidebar.exception(error)
-
-                time.sleep(10)  # Hold execution for 10s before clearing the warnings
-                flag_exception_raised.empty()
-
-            flag_display_result = False
-
-        if flag_display_result:  # Check if any result has been generated, to display
-            # Remove extra paddings from the top and bottom margin of block container
-            st.markdown(
-                """
-                    <style>
-                        .block-container {
-                                padding-top: 0rem;
-                    padding-bottom: -0.5rem;
-                            }
-                    </style>
-                    """,
-                unsafe_allow_html=True,
-            )
-
-            with gif_image:
-                # Display the preloader, as the web app performs time intensive tasks
-                st.toast("Warming up the digital oven")
-
-                # Initialize the GenerativeImageSynthesis mode,l for image generation
-                genisys_std_model = GenerativeImageSynthesis(
-                    image_quality="standard", enable_gpu_acceleration=False
-                )
-
-                # Generate the primary and secondary images based on the recipe title
-                generated_primary_image_path = genisys_std_model.generate_image(
-                    recipe_title, 424, 322
-                )
-
-                st.toast("Applying some final touches")
-
-                generated_secondary_image_path = genisys_std_model.generate_image(
-                    recipe_title, 284, 322
-                )
-
-                recipe_id = str(uuid.uuid4())[:8]
-
-                try:
-                    azure_storage_account = AzureStorageAccount(
-                        "generated-recipe-images"
-                    )
-
-                    blob_url_primary_image = (
-                        azure_storage_account.store_image_in_blob_container(
-                            generated_primary_image_path, recipe_id + "_primary.png"
-                        )
-                    )
-                    blob_url_secondary_image = (
-                        azure_storage_account.store_image_in_blob_container(
-                            generated_secondary_image_path, recipe_id + "_secondary.png"
-                        )
-                    )
-
-                except Exception as error:
-                    blob_url_primary_image = "unavailable"
-                    blob_url_secondary_image = "unavailable"
-
-                try:
-                    audio_prompt = f"Hello and welcome to RecipeML! You are listening to the recipe for preparing {recipe_title}. This recipe takes approximately {preperation_time_in_mins} minutes to cook and can be served to {serving_size} people. Before jumping right in, please be advised that recipes generated by RecipeML are intended for creative exploration only. The results may not always be safe, accurate, or edible. You may use it to spark inspiration, but always consult trusted sources for reliable cooking information. For preparing this recipe, you will need {recipe_ingredients}. Now, here's how we'll make magic happen, {recipe_instructions}. Congratulations, chef! Your feast is ready. Grab your utensils, gather your guests, and savor every bite of this delectable dish. Bon appétit!"
-
-                    try:
-                        if selected_language != "en":
-                            audio_prompt = GoogleTranslator(
-                                source="auto", target=selected_language
-                            ).translate(audio_prompt)
-
-                    except Exception as error:
-                        pass
-                    tts = gTTS(text=audio_prompt, lang="en", tld="co.in")
-
-                    recipe_audio_name = (
-                        recipe_title.replace("/", "").replace(" ", "_").lower()
-                        + "_audio.wav"
-                    )
-                    audio_path = f"exports/generated_aud/{recipe_audio_name}"
-
-                    tts.save(audio_path)
-
-                except Exception as error:
-                    pass
-
-                gif_image.empty()  # Show notification message, & clear the preloader
-
-            try:
-                if selected_language != "en":
-                    recipe_title = GoogleTranslator(
-                        source="auto", target=selected_language
-                    ).translate(recipe_title)
-            except Exception as error:
-                pass
-
-            # Display title on the web app's frontend and show the interactive button
-            st.markdown(f"<H2>{recipe_title}</H2>", unsafe_allow_html=True)
-
-            seprating_spaces = "&nbsp&nbsp&nbsp&nbsp&nbsp&nbsp"
-
-            serving_size_content = f"Serving for {serving_size}"
-            calories_in_recipe_content = f"{calories_in_recipe} Calories"
-            preparation_time_content = (
-                f"Requires {preperation_time_in_mins} minutes to prepare"
-            )
-
-            try:
-                if selected_language != "en":
-                    serving_size_content = GoogleTranslator(
-                        source="auto", target=selected_language
-                    ).translate(serving_size_content)
-                    calories_in_recipe_content = GoogleTranslator(
-                        source="auto", target=selected_language
-                    ).translate(calories_in_recipe_content)
-                    preparation_time_content = GoogleTranslator(
-                        source="auto", target=selected_language
-                    ).translate(preparation_time_content)
-
-            except Exception as error:
-                st.write(error)
-
-            st.markdown(
-                "<h5>🍜 "
-                + serving_size_content
-                + seprating_spaces
-                + "🔥 "
-                + calories_in_recipe_content
-                + seprating_spaces
-                + "🕓 "
-                + preparation_time_content
-                + "</h5><br>",
-                unsafe_allow_html=True,
-            )
-
-            primary_image, secondary_image = st.columns([1.48, 1])
-
-            # Display the primary and the secondary recipe image on the apps frontend
-            with primary_image:
-                if generated_primary_image_path:
-                    recipe_image_424x322 = Image.open(
-                        generated_primary_image_path
-                    ).resize((424, 322))
-
-                else:
-                    # Use the placeholder image if the primary image is not generated
-                    placeholder_image_path = (
-                        resource_registry.placeholder_image_dir_path
-                        + "placeholder_1.png"
-                    )
-                    recipe_image_424x322 = Image.open(placeholder_image_path).resize(
-                        (424, 322)
-                    )
-
-                st.image(recipe_image_424x322)  # Display the primary image, to users
-
-            with secondary_image:
-                if generated_secondary_image_path:
-                    recipe_image_424x322 = Image.open(
-                        generated_secondary_image_path
-                    ).resize((284, 322))
-
-                else:
-                    # Use a placeholder image if the secondary image is not generated
-                    placeholder_image_path = (
-                        resource_registry.placeholder_image_dir_path
-                        + "placeholder_2.png"
-                    )
-                    recipe_image_424x322 = Image.open(placeholder_image_path).resize(
-                        (284, 322)
-                    )
-
-                st.image(recipe_image_424x322)
-
-            # Display the description of the generated recipe & the recipe ingredient
-            try:
-                if selected_language != "en":
-                    recipe_description = GoogleTranslator(
-                        source="auto", target=selected_language
-                    ).translate(recipe_description)
-            except Exception as error:
-                pass
-
-            st.markdown(
-                f"<p align='justify'>{recipe_description}</p>", unsafe_allow_html=True
-            )
-
-            ingredients_title = "Ingredients"
-
-            try:
-                if selected_language != "en":
-                    ingredients_title = GoogleTranslator(
-                        source="auto", target=selected_language
-                    ).translate(ingredients_title)
-            except Exception as error:
-                pass
-
-            st.markdown("<H3>" + ingredients_title + "</H3>", unsafe_allow_html=True)
+                    # Handle the exception, & show the warning until the next rerun
+                    try:
+                        gif_image.empty()
 
-            recipe_ingredients = ", ".join(recipe_ingredients)  # Display ingredients
-            try:
-                if selected_language != "en":
-                    recipe_ingredients = GoogleTranslator(
-                        source="auto", target=selected_language
-                    ).translate(recipe_ingredients)
-            except Exception as error:
-                pass
+                    except:
+                        pass
 
-            st.markdown(
-                f"<p align='justify'>{recipe_ingredients}</p>", unsafe_allow_html=True
-            )
+                    _show_exception_preloader(202)
 
-            # Display a cautionary message to the user, about using generated recipes
-            usage_caution_message = """
-            **Enjoy the wordplay, but cook with caution!**
+                    flag_display_result = False
+            else:
+                flag_display_result = False
 
-            Recipes generated by RecipeML are intended for creative exploration only! The results may'nt always be safe, accurate, or edible! You may use it to spark inspiration but always consult trusted sources for reliable cooking information. For more information on safe cooking practices, kindly visit USDAs [FSIS](https://www.fsis.usda.gov/wps/portal/fsis/topics/food-safety-education)
-            """
-            st.info(usage_caution_message)
+        else:
+            # Handle unknown exception, & show the warning until the next rerun
+            _show_exception_preloader(203)
 
-            # Display the recipe direction heading and the cleaned recipe instruction
-            directions_heading = "Recipe Directions"
-            try:
-                if selected_language != "en":
-                    directions_heading = GoogleTranslator(
-                        source="auto", target=selected_language
-                    ).translate(directions_heading)
-            except Exception as error:
-                pass
+            flag_display_result = False
 
-            st.markdown("<H3>" + directions_heading + "</H3>", unsafe_allow_html=True)
+        if not flag_display_result:
+            # Render the landing page, and end the run, as there's no recipe to display
+            _render_landing_page(resource_registry)
+            st.stop()
+
+        # Remove extra paddings from the top margin of the block container
+        st.markdown(_RESULT_PAGE_CSS, unsafe_allow_html=True)
+
+        with gif_image:
+            # Display the preloader, as the web app performs time intensive tasks
+            st.toast("Warming up the digital oven")
+
+            # Build every string displayed to users, and start translating them
+            audio_prompt = _audio_prompt(
+                recipe_title,
+                preperation_time_in_mins,
+                serving_size,
+                recipe_ingredients,
+                recipe_instructions,
+            )
 
-            try:
-                if selected_language != "en":
-                    recipe_instructions = GoogleTranslator(
-                        source="auto", target=selected_language
-                    ).translate(recipe_instructions)
-            except Exception as error:
-                pass
+            serving_size_content = f"Serving for {serving_size}"
+            calories_in_recipe_content = f"{calories_in_recipe} Calories"
+            preparation_time_content = (
+                f"Requires {preperation_time_in_mins} minutes to prepare"
+            )
 
-            st.markdown(
-                f"<p align='justify'>{recipe_instructions}</p>", unsafe_allow_html=True
+            # Overlap translation & speech synthesis with the image generation
+            recipe_translation = _translate_for_session(
+                [
+                    recipe_title,
+                    serving_size_content,
+                    calories_in_recipe_content,
+                    preparation_time_content,
+                    recipe_description,
+                    ", ".join(recipe_ingredients),
+                    recipe_instructions,
+                ],
+                selected_language,
             )
 
-            st.markdown("<BR><BR>", unsafe_allow_html=True)
+            # The headings are constant, so they are served from the translation cache
+            headings_translation = _io_pool().submit(
+                _translate_many, ["Ingredients", "Recipe Directions"], selected_language
+            )
+            recipe_audio_synthesis = _io_pool().submit(
+                _synthesize_recipe_audio, audio_prompt, selected_language
+            )
 
-            st.sidebar.markdown("<BR><BR><BR><BR><BR><BR>", unsafe_allow_html=True)
-            st.sidebar.audio(audio_path, format="audio/wav")
+            # Reuse the images generated earlier in this session, for the same recipe
+            generated_recipe_images = st.session_state.setdefault(
+                "generated_recipe_images", {}
+            )
 
-            try:
-                mongo = MongoDB()
-
-                if st.session_state.authenticated_user_username is not None:
-                    username = st.session_state.authenticated_user_username
-                else:
-                    username = "guest_user"
-
-                if recipe_generation_type == "Generate by Ingredients":
-                    input_query = input_selected_ingredients
-                else:
-                    input_query = input_recipe_name
-
-                mongo.store_generated_recipes(
-                    username,
-                    recipe_generation_type,
-                    input_query,
-                    selected_language,
+            if recipe_title in generated_recipe_images:
+                (
                     recipe_id,
-                    recipe_title,
-                    recipe_ingredients,
-                    recipe_instructions,
-                    serving_size,
-                    preperation_time_in_mins,
-                    calories_in_recipe,
+                    generated_primary_image_path,
+                    generated_secondary_image_path,
                     blob_url_primary_image,
                     blob_url_secondary_image,
-                )
-            except Exception as error:
-                st.exception(error)
+                ) = generated_recipe_images[recipe_title]
 
-        else:
-            try:
-                # Load & display animated GIF for visual appeal, when not inferencing
-                if st.session_state.themes["current_theme"] == "dark":
-                    loading_gif = "intro_dotwave_img.gif"
-                else: loading_gif = "intro_dotwave_img_light.gif"
+            elif st.session_state.skip_images:
+                # Display the placeholders, without any image generation if opted out
+                recipe_id = str(uuid.uuid4())[:8]
 
-                dotwave_image_path = (
-                    resource_registry.loading_assets_dir + "dotwave_intro_img.gif"
-                )
+                generated_primary_image_path = None
+                generated_secondary_image_path = None
 
-                with open(dotwave_image_path, "rb") as f:
-                    image_data = f.read()
+                blob_url_primary_image = "unavailable"
+                blob_url_secondary_image = "unavailable"
 
-                    encoded_image = base64.b64encode(image_data).decode()
+            else:
+                # Fetch the shared GenerativeImageSynthesis model, for image generation
+                genisys_std_model = _image_generation_model()
 
-                    # Display base64 encoded image with rounded edge without expander
-                    gif_image = st.markdown(
-                        f'<br><br><div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div>',
-                        unsafe_allow_html=True,
-                    )
-            except Exception as error:
-                pass
+                # Generate the primary and secondary images based on the recipe title
+                (
+                    generated_primary_image_path,
+                    generated_secondary_image_path,
+                ) = _generate_images_concurrently(
+                    genisys_std_model, recipe_title, [(424, 322), (284, 322)]
+                )
 
-            # Display a welcoming message to user with a randomly chosen recipe emoji
-            cuisines_emojis = [
-                "🍜",
-                "🍩",
-                "🍚",
-                "🍝",
-                "🍦",
-                "🍣",
-            ]
+                st.toast("Applying some final touches")
 
-            cola, colb = st.columns([11.5, 1])
+                recipe_id = str(uuid.uuid4())[:8]
 
-            with cola:
-                if st.session_state.user_display_name is not None:
-                    user_first_name = st.session_state.user_display_name.split()[0]
+                blob_url_primary_image = "unavailable"
+                blob_url_secondary_image = "unavailable"
 
+                # Upload only the generated images, as placeholders are never stored
+                if generated_primary_image_path and generated_secondary_image_path:
                     try:
-                        st.markdown(
-                            f"<H1>Welcome {user_first_name} {random.choice(cuisines_emojis)}</H1>",
-                            unsafe_allow_html=True,
+                        azure_storage_account = AzureStorageAccount(
+                            "generated-recipe-images"
                         )
 
-                    except:
-                        st.markdown(
-                        f"<H1>Hello there {random.choice(cuisines_emojis)}</H1>",
-                        unsafe_allow_html=True,
-                    )
+                        blob_url_primary_image = (
+                            azure_storage_account.store_image_in_blob_container(
+                                generated_primary_image_path,
+                                recipe_id + "_primary.png",
+                            )
+                        )
+                        blob_url_secondary_image = (
+                            azure_storage_account.store_image_in_blob_container(
+                                generated_secondary_image_path,
+                                recipe_id + "_secondary.png",
+                            )
+                        )
 
-                else:
-                    st.markdown(
-                        f"<H1>Hello there {random.choice(cuisines_emojis)}</H1>",
-                        unsafe_allow_html=True,
+                    except Exception as error:
+                        blob_url_primary_image = "unavailable"
+                        blob_url_secondary_image = "unavailable"
+
+                if generated_primary_image_path and generated_secondary_image_path:
+                    generated_recipe_images[recipe_title] = (
+                        recipe_id,
+                        generated_primary_image_path,
+                        generated_secondary_image_path,
+                        blob_url_primary_image,
+                        blob_url_secondary_image,
                     )
 
-            with colb:
-                st.markdown("<br>", unsafe_allow_html=True)
-                btn_face = (
-                    st.session_state.themes["light"]["button_face"]
-                    if st.session_state.themes["current_theme"] == "light"
-                    else st.session_state.themes["dark"]["button_face"]
-                )
+            # Collect the translated strings, while the narration is still being saved
+            (
+                recipe_title,
+                serving_size_content,
+                calories_in_recipe_content,
+                preparation_time_content,
+                recipe_description,
+                recipe_ingredients,
+                recipe_instructions,
+            ) = recipe_translation.result()
+            ingredients_title, directions_heading = headings_translation.result()
+
+            gif_image.empty()  # Show notification message, & clear the preloader
+
+        # Display title on the web app's frontend and show the interactive button
+        st.markdown(f"<H2>{recipe_title}</H2>", unsafe_allow_html=True)
+
+        seprating_spaces = "&nbsp&nbsp&nbsp&nbsp&nbsp&nbsp"
+
+        st.markdown(
+            "<h5>🍜 "
+            + serving_size_content
+            + seprating_spaces
+            + "🔥 "
+            + calories_in_recipe_content
+            + seprating_spaces
+            + "🕓 "
+            + preparation_time_content
+            + "</h5><br>",
+            unsafe_allow_html=True,
+        )
+
+        primary_image, secondary_image = st.columns([1.48, 1])
 
-                st.button(
-                    btn_face,
-                    use_container_width=True,
-                    type="secondary",
-                    on_click=change_streamlit_theme,
+        # Display the primary and the secondary recipe image on the apps frontend
+        with primary_image:
+            if generated_primary_image_path:
+                # Generated images are already cropped to size, so display them as is
+                st.image(generated_primary_image_path, width=424)
+
+            else:
+                # Use the placeholder image if the primary image is not generated
+                placeholder_image_path = (
+                    resource_registry.placeholder_image_dir_path
+                    + "placeholder_1.png"
                 )
+                st.image(_load_resized_image(placeholder_image_path, (424, 322)))
 
-            # Provide a brief description of RecipeMLs recipe generation capabilities
-            subheading_font_color = {"dark": "#C2C2C2", "light": "#424242"}
-            font_color = subheading_font_color[st.session_state.themes["current_theme"]]
+        with secondary_image:
+            if generated_secondary_image_path:
+                st.image(generated_secondary_image_path, width=284)
 
-            st.markdown(
-                f"<H4 style='color: {font_color}'>Start by describing what you are craving, or what you have on hand!</H4>",
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                "<P align='justify'>Dreaming of a dish but dont have recipe? Or maybe you've got an ingredient begging to be transformed? Simply describe what you want and RecipeML will generate a mouthwatering recipe that is uniquely yours</P>",
-                unsafe_allow_html=True,
-            )
+            else:
+                # Use a placeholder image if the secondary image is not generated
+                placeholder_image_path = (
+                    resource_registry.placeholder_image_dir_path
+                    + "placeholder_2.png"
+                )
+                st.image(_load_resized_image(placeholder_image_path, (284, 322)))
 
-            # Display usage instructions in an informative box for easy understanding
-            usage_instruction = """
-            **Here's how you can get started:**
+        # Display the description of the generated recipe & the recipe ingredient
+        st.markdown(
+            f"<p align='justify'>{recipe_description}</p>", unsafe_allow_html=True
+        )
 
-            **1. Whisper your wish**: Enter the recipes name or a starting ingredient to get started with your journey
-            **2. Discover inspirations**: Explore new recipes, from tried-and-true classics to some unexpected twists
-            **3. Save your favourite recipes**: Download the PDF documents, or send'em to your registered email id
-            """
-            st.info(usage_instruction)  # Display the usage information, to the users
+        st.markdown("<H3>" + ingredients_title + "</H3>", unsafe_allow_html=True)
 
-    if selected_menu_item == "Discover RecipeML":
-        if "user_authentication_status" not in st.session_state:
-            st.session_state.user_authentication_status = None
+        st.markdown(
+            f"<p align='justify'>{recipe_ingredients}</p>", unsafe_allow_html=True
+        )
 
-        if "authenticated_user_email_id" not in st.session_state:
-            st.session_state.authenticated_user_email_id = None
+        # Display a cautionary message to the user, about using generated recipes
+        usage_caution_message = """
+        **Enjoy the wordplay, but cook with caution!**
 
-        if "authenticated_user_username" not in st.session_state:
-            st.session_state.authenticated_user_username = None
+        Recipes generated by RecipeML are intended for creative exploration only! The results may'nt always be safe, accurate, or edible! You may use it to spark inspiration but always consult trusted sources for reliable cooking information. For more information on safe cooking practices, kindly visit USDAs [FSIS](https://www.fsis.usda.gov/wps/portal/fsis/topics/food-safety-education)
+        """
+        st.info(usage_caution_message)
 
-        if "user_display_name" not in st.session_state:
-            st.session_state.user_display_name = None
+        # Display the recipe direction heading and the cleaned recipe instruction
+        st.markdown("<H3>" + directions_heading + "</H3>", unsafe_allow_html=True)
 
-        def _valid_name(fullname):
-            # Validate the basic structure, and logical name based character restrictions
-            if not re.match(r"^[A-Z][a-z]+( [A-Z][a-z]+)*$", fullname):
-                return False
+        st.markdown(
+            f"<p align='justify'>{recipe_instructions}</p>", unsafe_allow_html=True
+        )
 
-            return (
-                True  # Name is considered to be valid, only if all conditions are met
-            )
+        st.markdown("<BR><BR>", unsafe_allow_html=True)
 
-        def _valid_username(username):
-            # Check for the minimum and maximum length of the password (i.e 4 characters)
-            if len(username) < 4:
-                return False, "MINIMUM_LENGTH_UID"
-            if len(username) > 25:
-                return False, "MAXIMUM_LENGTH_UID"
+        st.sidebar.markdown("<BR><BR><BR><BR><BR><BR>", unsafe_allow_html=True)
 
-            # Check for only the allowed characters: letters, numbers, underscores & dots
-            allowed_chars = set(
-                "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_."
-            )
-            if not all(char in allowed_chars for char in username):
-                return False, "INVALID_CHARACTERS"
+        # Wait for the narration only now, as it is the last element to be rendered
+        try:
+            audio_path = recipe_audio_synthesis.result()
+            st.sidebar.audio(audio_path, format="audio/mp3")
 
-            # Check if username start with letter. Symbols & digits must not be the first
-            if not username[0].isalpha():
-                return False, "START_WITH_LETTERS"
+        except Exception as error:
+            pass
 
-            return (
-                True,
-                "USERNAME_VALID",
-            )  # Username is valid, if all conditions are met
+        try:
+            mongo = MongoDB()
 
-        def _valid_email_address(email):
-            # Define the regular expression for validating the e-mail address of the user
-            email_regex = r"^[a-zA-Z0-9.+_-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+            if st.session_state.authenticated_user_username is not None:
+                username = st.session_state.authenticated_user_username
+            else:
+                username = "guest_user"
 
-            # Returns a boolean value indicating whether the mail address is valid or not
-            return re.match(email_regex, email) is not None
+            if recipe_generation_type == "Generate by Ingredients":
+                input_query = input_selected_ingredients
+            else:
+                input_query = input_recipe_name
+
+            mongo.store_generated_recipes(
+                username,
+                recipe_generation_type,
+                input_query,
+                selected_language,
+                recipe_id,
+                recipe_title,
+                recipe_ingredients,
+                recipe_instructions,
+                serving_size,
+                preperation_time_in_mins,
+                calories_in_recipe,
+                blob_url_primary_image,
+                blob_url_secondary_image,
+            )
+        except Exception as error:
+            st.exception(error)
 
+    if selected_menu_item == "Discover RecipeML":
         def signup_form():
+            from firebase_admin import auth
+            from firebase_admin.exceptions import FirebaseError
+
             if st.session_state.user_authentication_status is None:
                 with st.form("register_new_user_form"):
                     st.markdown(
@@ -935,44 +1302,21 @@ if __name__ == "__main__":
 
                     if submitted:
                         try:
-                            if not name:
-                                st.toast("Please enter your full name")
-                            elif not _valid_name(name):
-                                st.toast("Not quite! Double-check your full name.")
-
-                            elif not _valid_username(username)[0]:
-                                validation_error_message = _valid_username(username)[1]
-
-                                if validation_error_message is "MINIMUM_LENGTH_UID":
-                                    st.toast("Username too short! Needs 4+ letters.")
-
-                                elif validation_error_message is "MAXIMUM_LENGTH_UID":
-                                    st.toast("Username too long! Max 25 letters.")
-
-                                elif validation_error_message is "INVALID_CHARACTERS":
-                                    st.toast("Username contains invalid charecters!")
-                                    time.sleep(1.5)
-                                    st.toast(
-                                        "Try again with valid chars (a-z, 0-9, ._)"
-                                    )
-
-                                elif validation_error_message is "START_WITH_LETTERS":
-                                    st.toast("Start your username with a letter.")
-
-                                else:
-                                    st.toast("Invalid Username! Try again.")
-
-                            elif not _valid_email_address(email):
-                                st.toast("Invalid email format. Please try again.")
-
-                            elif len(password) < 8:
-                                st.toast("Password too short! Needs 8+ characters.")
+                            # Validate the form in a single pass, & toast the first error
+                            validation_error_messages = _signup_form_errors(
+                                name,
+                                username,
+                                email,
+                                password,
+                                accept_terms_and_conditions,
+                            )
 
-                            elif not accept_terms_and_conditions:
-                                st.toast("Please accept our terms of use")
+                            if validation_error_messages:
+                                for toast_message in validation_error_messages:
+                                    st.toast(toast_message)
 
                             else:
-                                firebase_admin.auth.create_user(
+                                auth.create_user(
                                     uid=username.lower(),
                                     display_name=name,
                                     email=email,
@@ -981,20 +1325,12 @@ if __name__ == "__main__":
                                 )
                                 st.toast("Welcome to RecipeML!")
 
-                                alert_successful_account_creation = st.success(
-                                    "Your Account has been created successfully"
-                                )
-                                time.sleep(2)
-
+                                st.success("Your Account has been created successfully")
                                 st.toast("Please login to access your account.")
-                                time.sleep(3)
-                                alert_successful_account_creation.empty()
 
-                        except Exception as error:
+                        except (FirebaseError, ValueError) as error:
                             if "Invalid phone number" in str(error):
                                 st.toast("Invalid phone number format.")
-
-                                time.sleep(1.5)
                                 st.toast("Please check country code and + prefix.")
 
                             elif "PHONE_NUMBER_EXISTS" in str(error):
@@ -1007,14 +1343,21 @@ if __name__ == "__main__":
                                 st.toast("User with provided email already exists")
 
                             else:
-                                alert_failed_account_creation = st.warning(
+                                st.warning(
                                     "Oops! We could not create your account. Please check your connectivity and try again."
                                 )
-                                time.sleep(7)
-                                alert_failed_account_creation.empty()
 
         def login_form():
+            from firebase_admin import auth
+            from firebase_admin.exceptions import FirebaseError
+
             if st.session_state.user_authentication_status is None:
+                # Display the alert from the previous failed login, until the next rerun
+                if "login_failed_alert" in st.session_state:
+                    st.sidebar.warning(
+                        st.session_state.pop("login_failed_alert"), icon="⚠️"
+                    )
+
                 with st.sidebar.form("login_existing_user_form"):
                     email = st.text_input(
                         "Username / Email Id:", placeholder="Username or email address"
@@ -1039,14 +1382,24 @@ if __name__ == "__main__":
                             api_key = auth_token.firebase_api_key
                             base_url = "https://identitytoolkit.googleapis.com/v1/accounts:signInWithPassword?key={api_key}"
 
+                            # Resolve the username to its mail id, using a batched user lookup
                             if "@" not in email:
                                 username = email
-                                user = firebase_admin.auth.get_user(username)
-                                email = user.email
+                                user_lookup = auth.get_users(
+                                    [auth.UidIdentifier(username)]
+                                )
+
+                                if not user_lookup.users:
+                                    raise auth.UserNotFoundError(
+                                        f"No user record found for the provided user ID: {username}."
+                                    )
+                                email = user_lookup.users[0].email
 
                             data = {"email": email, "password": password}
-                            response = requests.post(
-                                base_url.format(api_key=api_key), json=data
+                            response = _http_session().post(
+                                base_url.format(api_key=api_key),
+                                json=data,
+                                timeout=(3, 10),
                             )
 
                             if response.status_code == 200:
@@ -1054,15 +1407,8 @@ if __name__ == "__main__":
 
                                 user_display_name = data["displayName"]
                                 user_email_id = email
-                                user_username = firebase_admin.auth.get_user_by_email(
-                                    email
-                                ).uid
-
-                                user_phone_number = (
-                                    firebase_admin.auth.get_user_by_email(
-                                        email
-                                    ).phone_number
-                                )
+                                # The sign in response already carries the uid, i.e the username
+                                user_username = data["localId"]
 
                                 st.session_state.user_authentication_status = True
                                 st.session_state.authenticated_user_email_id = (
@@ -1079,36 +1425,31 @@ if __name__ == "__main__":
                                 data = response.json()
                                 login_error_message = str(data["error"]["message"])
 
+                                # Store the alert, to be displayed with the login form after rerun
                                 if login_error_message == "INVALID_PASSWORD":
-                                    authentication_failed_alert = st.sidebar.warning(
-                                        "&nbsp; Invalid password. Try again.", icon="⚠️"
+                                    st.session_state.login_failed_alert = (
+                                        "&nbsp; Invalid password. Try again."
                                     )
                                 elif login_error_message == "EMAIL_NOT_FOUND":
-                                    authentication_failed_alert = st.sidebar.warning(
-                                        "&nbsp; User with this mail doesn't exist.",
-                                        icon="⚠️",
+                                    st.session_state.login_failed_alert = (
+                                        "&nbsp; User with this mail doesn't exist."
                                     )
                                 else:
-                                    authentication_failed_alert = st.sidebar.warning(
-                                        "&nbsp; Unable to login. Try again later.",
-                                        icon="⚠️",
+                                    st.session_state.login_failed_alert = (
+                                        "&nbsp; Unable to login. Try again later."
                                     )
 
-                                time.sleep(2)
-                                authentication_failed_alert.empty()
-
                                 st.session_state.user_authentication_status = False
                                 st.session_state.authenticated_user_email_id = None
                                 st.session_state.authenticated_user_username = None
                                 st.session_state.user_display_name = None
 
-                        except Exception as err:
-                            authentication_failed_alert = st.sidebar.warning(
-                                err, icon="⚠️"
-                            )
-
-                            time.sleep(2)
-                            authentication_failed_alert.empty()
+                        except (
+                            FirebaseError,
+                            ValueError,
+                            requests.exceptions.RequestException,
+                        ) as err:
+                            st.session_state.login_failed_alert = str(err)
 
                             st.session_state.user_authentication_status = False
                             st.session_state.authenticated_user_email_id = None
@@ -1140,263 +1481,41 @@ if __name__ == "__main__":
 
                 if st.button("Reset Password", use_container_width=True):
                     data = {"requestType": "PASSWORD_RESET", "email": email}
-                    response = requests.post(
-                        base_url.format(api_key=api_key), json=data
+                    response = _http_session().post(
+                        base_url.format(api_key=api_key), json=data, timeout=(3, 10)
                     )
 
                     if response.status_code == 200:
-                        alert_password_reset_mail_sent = st.success(
-                            "A password reset mail is on its way!"
-                        )
-                        st.toast("Success! Password reset email sent.")
+                        st.success("A password reset mail is on its way!")
 
-                        time.sleep(2)
+                        st.toast("Success! Password reset email sent.")
                         st.toast("Check your mailbox for next steps.")
 
-                        time.sleep(3)
-                        alert_password_reset_mail_sent.empty()
-
                     else:
-                        alert_password_reset_mail_failed = st.error(
-                            "Failed to send password reset mail"
-                        )
-                        st.toast("We're having trouble sending the email.")
+                        st.error("Failed to send password reset mail")
 
-                        time.sleep(2)
+                        st.toast("We're having trouble sending the email.")
                         st.toast("Double-check your mail id and try again")
 
-                        time.sleep(3)
-                        alert_password_reset_mail_failed.empty()
-
-        try:
-            firebase_credentials = FirebaseCredentials()
-            firebase_credentials.fetch_firebase_service_credentials(
-                "configurations/recipeml_firebase_secrets.json"
-            )
-
-            firebase_credentials = credentials.Certificate(
-                "configurations/recipeml_firebase_secrets.json"
-            )
-            firebase_admin.initialize_app(firebase_credentials)
-
-        except Exception as err:
-            pass
-
-        auth_token = AuthTokens()
-
-        # Display the Title of the ~/About_the_WebApp, and the sub-title as HTML headings
-        st.markdown(
-            "<H2>RecipeML - Cooking Just Got Smarter!</H2>",
-            unsafe_allow_html=True,
-        )
-
-        st.markdown(
-            "<H4>Start by describing few ingredients and unlock delicious possibilities</H4>",
-            unsafe_allow_html=True,
-        )
-
-        # Display the content for the intriduction section of the ~/About_the_WebApp page
-        st.markdown(
-            "<P align='justify'>Tired of staring at a fridge full of possibilities, only to end up with the same old stir-fry? Break free from the ordinary, & let RecipeML revolutionize your kitchen experience, with the power of Artificial Intelligence</P>",
-            unsafe_allow_html=True,
-        )
-
-        st.markdown(
-            "<P align='justify'>Start by describing what you have in hand, and RecipeML will work its magic. Whether it's that leftover bag of spinach or a fridge begging for rescue, RecipeML transforms ordinary ingredients into extraordinary dishes. But wait, there's more! Beyond recommending those existing recipes, RecipeML taps into its deep understanding of language generation to conjure up novel recipes, that no cook book has ever dreamt of!!</P>",
-            unsafe_allow_html=True,
-        )
-
-        (
-            icon0,
-            icon1,
-            icon2,
-            icon3,
-            icon4,
-            icon5,
-            icon6,
-            icon7,
-            icon8,
-            icon9,
-        ) = st.columns(10)
-
-        with icon0:
-            if st.session_state.themes["current_theme"] == "dark":
-                icon_path = "assets/icons/1.png"
-            else:
-                icon_path = "assets/icons/light1.png"
-            with open(
-                icon_path, "rb"
-            ) as f:  # Display the robot avatar image
-                image_data = f.read()
-                encoded_image = base64.b64encode(image_data).decode()
-
-                gif_image = st.markdown(
-                    f'<div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div>',
-                    unsafe_allow_html=True,
-                )
-
-        with icon1:
-            if st.session_state.themes["current_theme"] == "dark":
-                icon_path = "assets/icons/2.png"
-            else:
-                icon_path = "assets/icons/light2.png"
-            with open(
-                icon_path, "rb"
-            ) as f:  # Display the robot avatar image
-                image_data = f.read()
-                encoded_image = base64.b64encode(image_data).decode()
-
-                gif_image = st.markdown(
-                    f'<div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div>',
-                    unsafe_allow_html=True,
-                )
-
-        with icon2:
-            if st.session_state.themes["current_theme"] == "dark":
-                icon_path = "assets/icons/3.png"
-            else:
-                icon_path = "assets/icons/light3.png"
-            with open(
-                icon_path, "rb"
-            ) as f:  # Display the robot avatar image
-                image_data = f.read()
-                encoded_image = base64.b64encode(image_data).decode()
-
-                gif_image = st.markdown(
-                    f'<div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div>',
-                    unsafe_allow_html=True,
-                )
-
-        with icon3:
-            if st.session_state.themes["current_theme"] == "dark":
-                icon_path = "assets/icons/4.png"
-            else:
-                icon_path = "assets/icons/light4.png"
-            with open(
-                icon_path, "rb"
-            ) as f:  # Display the robot avatar image
-                image_data = f.read()
-                encoded_image = base64.b64encode(image_data).decode()
-
-                gif_image = st.markdown(
-                    f'<div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div>',
-                    unsafe_allow_html=True,
-                )
-
-        with icon4:
-            if st.session_state.themes["current_theme"] == "dark":
-                icon_path = "assets/icons/5.png"
-            else:
-                icon_path = "assets/icons/light5.png"
-            with open(
-                icon_path, "rb"
-            ) as f:  # Display the robot avatar image
-                image_data = f.read()
-                encoded_image = base64.b64encode(image_data).decode()
-
-                gif_image = st.markdown(
-                    f'<div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div>',
-                    unsafe_allow_html=True,
-                )
-
-        with icon5:
-            if st.session_state.themes["current_theme"] == "dark":
-                icon_path = "assets/icons/6.png"
-            else:
-                icon_path = "assets/icons/light6.png"
-            with open(
-                icon_path, "rb"
-            ) as f:  # Display the robot avatar image
-                image_data = f.read()
-                encoded_image = base64.b64encode(image_data).decode()
-
-                gif_image = st.markdown(
-                    f'<div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div>',
-                    unsafe_allow_html=True,
-                )
-
-        with icon6:
-            if st.session_state.themes["current_theme"] == "dark":
-                icon_path = "assets/icons/7.png"
-            else:
-                icon_path = "assets/icons/light7.png"
-            with open(
-                icon_path, "rb"
-            ) as f:  # Display the robot avatar image
-                image_data = f.read()
-                encoded_image = base64.b64encode(image_data).decode()
-
-                gif_image = st.markdown(
-                    f'<div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div>',
-                    unsafe_allow_html=True,
-                )
-
-        with icon7:
-            if st.session_state.themes["current_theme"] == "dark":
-                icon_path = "assets/icons/8.png"
-            else:
-                icon_path = "assets/icons/light8.png"
-            with open(
-                icon_path, "rb"
-            ) as f:  # Display the robot avatar image
-                image_data = f.read()
-                encoded_image = base64.b64encode(image_data).decode()
-
-                gif_image = st.markdown(
-                    f'<div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div>',
-                    unsafe_allow_html=True,
-                )
-
-        with icon8:
-            if st.session_state.themes["current_theme"] == "dark":
-                icon_path = "assets/icons/9.png"
-            else:
-                icon_path = "assets/icons/light9.png"
-            with open(
-                icon_path, "rb"
-            ) as f:  # Display the robot avatar image
-                image_data = f.read()
-                encoded_image = base64.b64encode(image_data).decode()
-
-                gif_image = st.markdown(
-                    f'<div class="rounded-image"><img src="data:image/png;base64,{encoded_image}"></div>',
-                    unsafe_allow_html=True,
-                )
-
-        with icon9:
-            if st.session_state.themes["current_theme"] == "dark":
-                icon_path = "assets/icons/10.png"
-            else:
-                icon_path = "assets/icons/light10.png"
-            st.image(
-                icon_path,
-            )  # Display the roboavatar on the explore page
-
-        st.markdown(
-            "<H5>So what are you waiting for? Elevate your cooking game, discover new flavors, and redefine your kitchen escapades with RecipeML, now available across all countries</H5>",
-            unsafe_allow_html=True,
-        )
+        # Initialize the Firebase app, and the API tokens once for the whole process
+        _initialize_firebase_app()
+        auth_token = _auth_tokens()
 
-        # Display section heading for Register Now to Try RecipeML, & display the content
-        st.markdown(
-            "<H3>No Hidden Ingredients Here! - RecipeML v1.3 Privacy Policy</H3>",
-            unsafe_allow_html=True,
-        )
+        # Display the title, the sub-title and the introduction of ~/About_the_WebApp
+        st.markdown(_ABOUT_INTRODUCTION_HTML, unsafe_allow_html=True)
 
-        st.markdown(
-            "<P align='justify'>Safety starts with understanding how we collect and share your data while using RecipeML. We believe that responsible innovation doesn't happen in isolation. As part of our efforts to enhance the outcomes, your usage information & feedback will be collected, and further used to improve our language algorithms</P>",
-            unsafe_allow_html=True,
-        )
+        # Fetch the themed feature icons, encoded only once per theme for the process
+        discover_icons = _discover_icons(st.session_state.themes["current_theme"])
 
-        st.markdown(
-            "<P align='justify'><B>•&nbsp&nbsp&nbsp What we collect:</B> We collect your chosen ingredients, feedback on the outcomes & basic app usage data<BR><B>•&nbsp&nbsp&nbsp What we dont:</B> We never share your information with third parties for marketing or advertising purpose</P>",
-            unsafe_allow_html=True,
-        )
+        # Display the feature icons, each one in its own column across the page width
+        for icon_column, encoded_icon in zip(st.columns(10), discover_icons):
+            icon_column.markdown(
+                f'<div class="rounded-image"><img src="data:image/png;base64,{encoded_icon}"></div>',
+                unsafe_allow_html=True,
+            )
 
-        st.markdown(
-            "<P align='justify'>Should you ever wish to discontinue your participation, we encourage you to reach out to us via email. Your privacy and preferences matter and we want to ensure your experience aligns with your comfort level</P>",
-            unsafe_allow_html=True,
-        )
+        # Display the call to action, and the privacy policy section, as a single block
+        st.markdown(_ABOUT_PRIVACY_POLICY_HTML, unsafe_allow_html=True)
 
         # Display a cautionary message to user about using generated recipes with caution
         usage_caution_message = """
@@ -1414,53 +1533,34 @@ if __name__ == "__main__":
         # Perform authentication using streamlit authenticator, and retrieve user details
         authentication_status, email_id = login_form()
 
-        try:
-            if authentication_status is not True:
-                st.markdown("---", unsafe_allow_html=True)
-                st.markdown("<BR>", unsafe_allow_html=True)
-
-                signup_form()
-                st.markdown("<BR>", unsafe_allow_html=True)
-
-                reset_password_form()
-
-                st.markdown(
-                    f"<BR>",
-                    unsafe_allow_html=True,
-                )
+        if authentication_status is None:
+            st.markdown("---", unsafe_allow_html=True)
+            st.markdown("<BR>", unsafe_allow_html=True)
 
-        except Exception as error:
-            pass
+            signup_form()
+            st.markdown("<BR>", unsafe_allow_html=True)
 
-        try:
-            if authentication_status is None:
-                pass
+            reset_password_form()
 
-        except Exception as error:
-            pass
+            st.markdown(
+                f"<BR>",
+                unsafe_allow_html=True,
+            )
 
         # Rerun the streamlit application if authentication fails for a user during login
-        try:
-            if authentication_status is False:
-                st.session_state.user_authentication_status = None
-                st.rerun()
-
-        except Exception as error:
-            pass
+        elif authentication_status is False:
+            st.session_state.user_authentication_status = None
+            st.rerun()
 
         # When logged in, display the message and the logout button, and the dark message
-        try:
-            if authentication_status is True:
-                authentication_success_alert = st.sidebar.success(
-                    "Succesfully logged in to RecipeML",
-                )
-
-                st.sidebar.markdown(
-                    "<BR><BR><BR><BR><BR><BR><BR><BR><BR><BR>", unsafe_allow_html=True
-                )
-                st.sidebar.write(" ")
+        else:
+            authentication_success_alert = st.sidebar.success(
+                "Succesfully logged in to RecipeML",
+            )
 
-                logout_button()
+            st.sidebar.markdown(
+                "<BR><BR><BR><BR><BR><BR><BR><BR><BR><BR>", unsafe_allow_html=True
+            )
+            st.sidebar.write(" ")
 
-        except Exception as error:
-            pass
+            logout_button()
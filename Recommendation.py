@@ -1,3 +1,4 @@
+import os
 import re
 import ast
 import uuid
@@ -9,6 +10,8 @@ import random
 import pickle
 import joblib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import nltk
 import numpy as np
@@ -138,6 +141,28 @@ def set_generate_recommendations_cache_to_false():
     st.session_state.cache_generate_recommendations = False
 
 
+@st.cache_resource(show_spinner=False)
+def _recommendation_api_session():
+    # Keep the recommendation API connections alive, & retry the transient errors.
+    # Read timeouts aren't retried, so a hung API blocks the rerun only just once
+    http_session = requests.Session()
+    http_adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2,
+            read=0,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset(["GET", "POST"]),
+        ),
+    )
+
+    http_session.mount("http://", http_adapter)
+    http_session.mount("https://", http_adapter)
+    return http_session
+
+
 def apply_style_to_sidebar_button(css_file_name):
     with open(css_file_name, encoding="utf-8") as file:
         st.markdown(f"<style>{file.read()}</style>", unsafe_allow_html=True)
@@ -267,13 +292,16 @@ if __name__ == "__main__":
                 if use_large_model is True:
                     try:
                         recipeml_flask_api_url = auth_token.recipeml_flask_api_url
-                        response = requests.post(
-                            recipeml_flask_api_url, json=input_ingredients
+                        response = _recommendation_api_session().post(
+                            recipeml_flask_api_url,
+                            json=input_ingredients,
+                            timeout=(3, 10),
                         )
 
                         if response.status_code == 200:
-                            # Extract and print the first recommended recipe's details from JSON response
-                            recommended_recipes_indices = response.json()["recipe_id"]
+                            # Parse the JSON response once, and reuse it for every recipe lookup
+                            recipe_payload = response.json()
+                            recommended_recipes_indices = recipe_payload["recipe_id"]
                         else:
                             use_large_model = False
 
@@ -284,12 +312,37 @@ if __name__ == "__main__":
 
                     @st.cache_data(show_spinner=False)
                     def _load_dataset_for_inferencing():
+                        parquet_dataset_path = "data/processed/recipe_nlg_batch_datasets/recipeml_processed_data.parquet"
+
                         dataset_path_1 = "data/processed/recipe_nlg_batch_datasets/recipeml_processed_data_split_1.csv"
                         dataset_path_2 = "data/processed/recipe_nlg_batch_datasets/recipeml_processed_data_split_2.csv"
                         dataset_path_3 = "data/processed/recipe_nlg_batch_datasets/recipeml_processed_data_split_3.csv"
                         dataset_path_4 = "data/processed/recipe_nlg_batch_datasets/recipeml_processed_data_split_4.csv"
                         dataset_path_5 = "data/processed/recipe_nlg_batch_datasets/recipeml_processed_data_split_5.csv"
 
+                        # Read the columnar copy, only if it's newer than every CSV split
+                        try:
+                            latest_split_mtime = max(
+                                os.path.getmtime(dataset_path)
+                                for dataset_path in (
+                                    dataset_path_1,
+                                    dataset_path_2,
+                                    dataset_path_3,
+                                    dataset_path_4,
+                                    dataset_path_5,
+                                )
+                            )
+
+                            if (
+                                os.path.getmtime(parquet_dataset_path)
+                                >= latest_split_mtime
+                            ):
+                                return pd.read_parquet(
+                                    parquet_dataset_path, engine="pyarrow"
+                                )
+                        except Exception:
+                            pass
+
                         dataset1 = pd.read_csv(dataset_path_1)
                         dataset2 = pd.read_csv(dataset_path_2)
                         dataset3 = pd.read_csv(dataset_path_3)
@@ -310,6 +363,25 @@ if __name__ == "__main__":
                         )
 
                         recipe_data.dropna(inplace=True)
+
+                        # Build the columnar copy once, so later loads skip CSV parsing
+                        partial_dataset_path = (
+                            f"{parquet_dataset_path}.{uuid.uuid4().hex}.part"
+                        )
+
+                        try:
+                            recipe_data.to_parquet(
+                                partial_dataset_path,
+                                engine="pyarrow",
+                                compression="snappy",
+                            )
+                            os.replace(partial_dataset_path, parquet_dataset_path)
+                        except Exception:
+                            try:
+                                os.remove(partial_dataset_path)
+                            except OSError:
+                                pass
+
                         return recipe_data
 
                     recipe_data = _load_dataset_for_inferencing()
@@ -377,7 +449,7 @@ if __name__ == "__main__":
                         recipe_preperation_time,
                         recipe_url,
                     ) = feature_space_matching.lookup_recipe_details_by_index(
-                        response.json(), 0, True
+                        recipe_payload, 0, True
                     )
 
                 else:
@@ -573,7 +645,7 @@ if __name__ == "__main__":
                         recipe_preperation_time,
                         recipe_url,
                     ) = feature_space_matching.lookup_recipe_details_by_index(
-                        response.json(), 3, True
+                        recipe_payload, 3, True
                     )
 
                 else:
@@ -768,7 +840,7 @@ if __name__ == "__main__":
                         recipe_preperation_time,
                         recipe_url,
                     ) = feature_space_matching.lookup_recipe_details_by_index(
-                        response.json(), 1, True
+                        recipe_payload, 1, True
                     )
 
                 else:
@@ -964,7 +1036,7 @@ if __name__ == "__main__":
                         recipe_preperation_time,
                         recipe_url,
                     ) = feature_space_matching.lookup_recipe_details_by_index(
-                        response.json(), 4, True
+                        recipe_payload, 4, True
                     )
 
                 else:
@@ -1159,7 +1231,7 @@ if __name__ == "__main__":
                         recipe_preperation_time,
                         recipe_url,
                     ) = feature_space_matching.lookup_recipe_details_by_index(
-                        response.json(), 2, True
+                        recipe_payload, 2, True
                     )
 
                 else:
@@ -1355,7 +1427,7 @@ if __name__ == "__main__":
                         recipe_preperation_time,
                         recipe_url,
                     ) = feature_space_matching.lookup_recipe_details_by_index(
-                        response.json(), 5, True
+                        recipe_payload, 5, True
                     )
 
                 else:
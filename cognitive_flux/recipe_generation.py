@@ -28,6 +28,7 @@ The usage of each class & their methods are described in corresponding docstring
 Classes and Functions:
     [1] ProceduralTextGeneration (class)
         [a] generate_recipe
+        [b] is_placeholder_recipe
 
 .. versionadded:: 1.3.0
 
@@ -67,6 +68,14 @@ except:
 
 from configurations.resource_path import ResourceRegistry
 
+# Default values returned in place of the recipe details, when the PaLM calls fail
+PLACEHOLDER_RECIPE_TITLE = "Lorem Ipsum Dolor Mit"
+PLACEHOLDER_RECIPE_DESCRIPTION = (
+    "This wonderful dish is a delightful blend of flavors and textures. The carefully selected ingredients come together to create a truly satisfying and memorable experience. Each bite is bursting with flavor, and the aroma is simply divine. Whether you are a seasoned cook, or just starting out, this recipe is sure to impress"
+    + "<br><br>"
+    + "Feeling adventurous? Experiment with different spices and herbs to create your own unique flavor profile. No matter how you choose to prepare it, this masterpiece is sure to become a goto favorite in your kitchen"
+)
+
 
 class ProceduralTextGeneration:
     """
@@ -79,6 +88,7 @@ class ProceduralTextGeneration:
 
     Class Methods:
         [1] generate_recipe
+        [2] is_placeholder_recipe
 
     .. versionadded:: 1.3.0
 
@@ -102,6 +112,11 @@ class ProceduralTextGeneration:
         self.max_token_length = max_token_length
         self.palm_api_key = palm_api_key
 
+        # Initialize the PaLM module components once, and reuse for each generation
+        self.palm_prompt_module = PaLMPromptModule()
+        self.palm_language_model = PaLMLanguageModel(self.palm_api_key)
+        self.palm_style_transfer = PaLMStyleTransfer()
+
     def generate_recipe(self, user_input_query, generate_recipe_by_name=True):
         """
         Method to generate a recipe based on user input using advanced NLP models
@@ -195,10 +210,10 @@ class ProceduralTextGeneration:
                 )
             except: pass
 
-            # Initialize the PaLM module components for recipe details generation
-            palm_prompt_module = PaLMPromptModule()
-            palm_language_model = PaLMLanguageModel(self.palm_api_key)
-            palm_style_transfer = PaLMStyleTransfer()
+            # Fetch the PaLM module components, for the recipe details generation
+            palm_prompt_module = self.palm_prompt_module
+            palm_language_model = self.palm_language_model
+            palm_style_transfer = self.palm_style_transfer
 
             # Generate prompts & use PaLM for paraphrasing and details generation
             recipe_preperation_time_calories_and_serving_size_prompt = palm_prompt_module.generate_recipe_preperation_time_and_serving_size_prompt(
@@ -218,7 +233,9 @@ class ProceduralTextGeneration:
             )
 
         else:
-            palm_prompt_module = PaLMPromptModule()  # Generates prompts for PaLM
+            palm_prompt_module = self.palm_prompt_module  # Prompts for the PaLM
+            palm_language_model = self.palm_language_model
+            palm_style_transfer = self.palm_style_transfer
             generate_recipe_prompt = palm_prompt_module.generate_recipe_by_name_prompt(
                 user_input_query
             )
@@ -228,16 +245,12 @@ class ProceduralTextGeneration:
             try:
                 # Attempt to generate the recipe till the successful paraphrasing
                 while is_paraphrase_success is False:
-                    palm_language_model = PaLMLanguageModel(
-                        self.palm_api_key
-                    )  # True, 0.7, 1500
                     generated_recipe = palm_language_model.generate_text(
                         generate_recipe_prompt,
                         self.stochasticity,
                         self.max_token_length,
                     )
 
-                    palm_style_transfer = PaLMStyleTransfer()  # Initialize class
                     (
                         is_paraphrase_success,
                         recipe_list,
@@ -256,7 +269,7 @@ class ProceduralTextGeneration:
 
             except Exception as error:
                 # Handle any PaLM driven exceptions, by providing a default value
-                recipe_title = "Lorem Ipsum Dolor Mit"
+                recipe_title = PLACEHOLDER_RECIPE_TITLE
                 recipe_ingredients = 'Unavailable'
                 recipe_instructions = 'Unavailable'
 
@@ -290,11 +303,7 @@ class ProceduralTextGeneration:
 
         except Exception as error:
             # Handle exception for description by providing a default description
-            recipe_description = (
-                f"This wonderful dish is a delightful blend of flavors and textures. The carefully selected ingredients come together to create a truly satisfying and memorable experience. Each bite is bursting with flavor, and the aroma is simply divine. Whether you are a seasoned cook, or just starting out, this recipe is sure to impress"
-                + "<br><br>"
-                + "Feeling adventurous? Experiment with different spices and herbs to create your own unique flavor profile. No matter how you choose to prepare it, this masterpiece is sure to become a goto favorite in your kitchen"
-            )
+            recipe_description = PLACEHOLDER_RECIPE_DESCRIPTION
 
         return (
             recipe_title,
@@ -305,3 +314,26 @@ class ProceduralTextGeneration:
             recipe_description,
             calories_in_recipe
         )
+
+    @staticmethod
+    def is_placeholder_recipe(recipe):
+        """
+        Method to check if a generated recipe is the placeholder for a PaLM error
+
+        generate_recipe does not raise when the PaLM API call fails, but returns a
+        placeholder recipe, or the placeholder description for the failed detail.
+        This method lets the callers tell them apart, for instance, to avoid the
+        caching of a placeholder or partial result in place of the actual recipe.
+
+        .. versionadded:: 1.3.0
+
+        Parameters:
+            [tuple] recipe: The seven-tuple that is returned by the generate_recipe
+
+        Returns:
+            [bool] True if the title or the description is the placeholder value
+        """
+        return (
+            recipe[0] == PLACEHOLDER_RECIPE_TITLE
+            or recipe[5] == PLACEHOLDER_RECIPE_DESCRIPTION
+        )
@@ -48,6 +48,7 @@ Learn about RecipeML :ref:`RecipeML: RecipeGeneration - Generating recipe by Nam
 import re
 import ast
 import pprint
+import functools
 import google.generativeai as palm
 import random
 
@@ -79,6 +80,11 @@ class PaLMLanguageModel:
         self.api_key = api_key
         palm.configure(api_key=self.api_key)  # Configure the PaLM language model
 
+        # Bind the model name once, so each call only passes the varying arguments
+        self._generate_text = functools.partial(
+            palm.generate_text, model="models/text-bison-001"
+        )
+
     def generate_text(self, prompt, randomness=0.7, max_response_length=1000):
         """
         Method to generate unique recipe text using Google Pathway Language model
@@ -99,8 +105,7 @@ class PaLMLanguageModel:
         Returns:
             [str] padded_start_string: Generated recipe based on the given prompt
         """
-        completion = palm.generate_text(
-            model="models/text-bison-001",
+        completion = self._generate_text(
             prompt=prompt,
             temperature=randomness,
             max_output_tokens=max_response_length,
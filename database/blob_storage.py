@@ -9,8 +9,8 @@ class AzureStorageAccount:
         self.connection_string = auth_tokens.azure_storage_account_connection_string
         self.container_name = container_name
 
-    def store_image_in_blob_container(self, file_path, blob_name):
-        if filepath.lower() == "unavailable":
+    def store_image_in_blob_container(self, file_path, blob_name, skip_if_exists=False):
+        if file_path is None or file_path.lower() == "unavailable":
             return "unavailable"
 
         blob_service_client = BlobServiceClient.from_connection_string(
@@ -20,6 +20,9 @@ class AzureStorageAccount:
         container_client = blob_service_client.get_container_client(self.container_name)
         blob_client = container_client.get_blob_client(blob_name)
 
+        if skip_if_exists and blob_client.exists():
+            return blob_client.url
+
         with open(file_path, "rb") as data:
             upload_stream = data.read()
             blob_client.upload_blob(upload_stream, overwrite=True)
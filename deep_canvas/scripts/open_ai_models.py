@@ -73,6 +73,9 @@ class DALLE2(ImageTransformation):
         # Fetch OpenAIs API credentials from ~/secrets.toml via secret management
         self.client = OpenAI(api_key=self.openai_api_key)
 
+        # Reuse the connections to the image CDN, across the generated downloads
+        self.http_session = requests.Session()
+
     def generate_recipe_image(
         self, recipe_name, desired_width=512, desired_height=512, quality="standard"
     ):
@@ -116,7 +119,7 @@ class DALLE2(ImageTransformation):
         image_url = response.data[0].url  # Fetch the link of the generated image
 
         # Retrieve the image generated by the DALLE2 model & save it in ~/exports
-        image_response = requests.get(image_url)
+        image_response = self.http_session.get(image_url, timeout=(3, 30))
         image_bytes = BytesIO(image_response.content)
 
         image = Image.open(image_bytes)